@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the Numba kernels in src/core/_kernels.py.
+
+Builds src/core/_core_kernels (a native extension module) with
+numba.pycc so the app starts without JIT-compiling the kernels on first
+run, and runs them even where Numba isn't installed. Without the built
+module the app falls back to the JIT (or NumPy) versions.
+
+Rebuild after editing _kernels.py - the built module takes precedence
+over the source (set DANCELEARN_NO_AOT=1 to ignore it).
+
+Usage:
+    pip install numba
+    python build_kernels.py
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+from src.core import _kernels
+
+
+def main():
+    cc = CC('_core_kernels')
+    cc.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'core')
+    cc.verbose = True
+
+    # Export the pure-Python bodies of the @njit kernels with the same
+    # signatures. The _jit_* names are never replaced by a previous build,
+    # so rebuilding always compiles the current source.
+    cc.export('compute_angles', _kernels.COMPUTE_ANGLES_SIG)(_kernels._jit_compute_angles.py_func)
+    cc.export('score_angles', _kernels.SCORE_ANGLES_SIG)(_kernels._jit_score_angles.py_func)
+    cc.export('find_weak_sections', _kernels.FIND_WEAK_SECTIONS_SIG)(_kernels._jit_find_weak_sections.py_func)
+    cc.export('calibration_checks', _kernels.CALIBRATION_CHECKS_SIG)(_kernels._jit_calibration_checks.py_func)
+
+    cc.compile()
+    print(f"Built _core_kernels in {cc.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
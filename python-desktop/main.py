@@ -12,6 +12,11 @@ Requirements:
     pip install -r requirements.txt
 """
 
+from src.runtime_env import configure_inference_env
+
+# Threading env for the inference libraries - before anything loads them
+configure_inference_env()
+
 from src.app import main
 
 if __name__ == "__main__":
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Precompute teacher poses for a dance video.
+
+Runs pose detection over every frame once and saves the result next to
+the video as `<video>.poses.npz`. When that file exists the app looks up
+teacher poses by timestamp instead of running MediaPipe on the teacher
+video during the session.
+
+Usage:
+    python preprocess_teacher.py path/to/video.mp4 [--model-complexity 1]
+"""
+
+import argparse
+import sys
+
+from src.runtime_env import configure_inference_env
+
+# Threading env for the inference libraries - before anything loads them
+configure_inference_env()
+
+from src.core.teacher_track import TeacherPoseTrack, track_path_for
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute teacher poses for a video")
+    parser.add_argument("video", help="Teacher video file")
+    parser.add_argument(
+        "--model-complexity", type=int, default=1, choices=(0, 1, 2),
+        help="MediaPipe model: 0=Lite, 1=Full, 2=Heavy (default: 1)",
+    )
+    args = parser.parse_args()
+
+    def report(index: int, total: int):
+        if total > 0 and (index % 30 == 0 or index == total):
+            print(f"\rProcessing frame {index}/{total}", end="", flush=True)
+
+    try:
+        track = TeacherPoseTrack.build(
+            args.video,
+            model_complexity=args.model_complexity,
+            progress=report,
+        )
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    out_path = track_path_for(args.video)
+    track.save(out_path)
+    print(f"\nSaved {len(track)} frames ({int(track.valid.sum())} with a pose) to {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,11 +3,13 @@ Application - PyQt6 application setup with dark theme.
 """
 
 import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QPalette, QColor
+from pathlib import Path
+from PyQt6.QtWidgets import QApplication, QSplashScreen
+from PyQt6.QtGui import QPalette, QColor, QPixmap
 from PyQt6.QtCore import Qt
 
-from .ui.main_window import MainWindow
+# Stylesheets and other non-Python assets
+RESOURCES_DIR = Path(__file__).parent / "resources"
 
 
 def create_dark_palette() -> QPalette:
@@ -53,225 +55,23 @@ def create_dark_palette() -> QPalette:
     return palette
 
 
-DARK_STYLESHEET = """
-QMainWindow {
-    background-color: #121212;
-}
+def load_stylesheet(name: str) -> str:
+    """Read a Qt stylesheet (.qss) from the resources folder."""
+    return (RESOURCES_DIR / name).read_text(encoding="utf-8")
 
-QWidget {
-    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Arial, sans-serif;
-}
 
-QMenuBar {
-    background-color: #1f1f1f;
-    color: white;
-    border-bottom: 1px solid #333;
-    padding: 4px 8px;
-}
+def create_splash_screen() -> QSplashScreen:
+    """Create a plain dark splash screen shown during startup."""
+    pixmap = QPixmap(420, 220)
+    pixmap.fill(QColor(18, 18, 18))
 
-QMenuBar::item {
-    padding: 6px 12px;
-    border-radius: 4px;
-}
-
-QMenuBar::item:selected {
-    background-color: #3b82f6;
-}
-
-QMenu {
-    background-color: #262626;
-    color: white;
-    border: 1px solid #333;
-    border-radius: 8px;
-    padding: 4px;
-}
-
-QMenu::item {
-    padding: 8px 24px;
-    border-radius: 4px;
-}
-
-QMenu::item:selected {
-    background-color: #3b82f6;
-}
-
-QMenu::separator {
-    height: 1px;
-    background: #333;
-    margin: 4px 8px;
-}
-
-QPushButton {
-    background-color: #374151;
-    color: white;
-    border: none;
-    border-radius: 8px;
-    padding: 8px 16px;
-    font-weight: 500;
-}
-
-QPushButton:hover {
-    background-color: #4b5563;
-}
-
-QPushButton:pressed {
-    background-color: #1f2937;
-}
-
-QPushButton:disabled {
-    background-color: #1f2937;
-    color: #666;
-}
-
-QComboBox {
-    background-color: #374151;
-    color: white;
-    border: none;
-    border-radius: 6px;
-    padding: 8px 12px;
-    min-width: 100px;
-}
-
-QComboBox::drop-down {
-    border: none;
-    width: 20px;
-}
-
-QComboBox::down-arrow {
-    width: 12px;
-    height: 12px;
-}
-
-QComboBox QAbstractItemView {
-    background-color: #374151;
-    color: white;
-    selection-background-color: #3b82f6;
-    border: 1px solid #4b5563;
-    border-radius: 6px;
-}
-
-QCheckBox {
-    color: #ccc;
-    spacing: 8px;
-}
-
-QCheckBox::indicator {
-    width: 18px;
-    height: 18px;
-    border-radius: 4px;
-    border: 2px solid #4b5563;
-    background-color: transparent;
-}
-
-QCheckBox::indicator:checked {
-    background-color: #3b82f6;
-    border-color: #3b82f6;
-}
-
-QCheckBox::indicator:hover {
-    border-color: #3b82f6;
-}
-
-QSlider::groove:horizontal {
-    height: 6px;
-    background: #374151;
-    border-radius: 3px;
-}
-
-QSlider::handle:horizontal {
-    background: #3b82f6;
-    width: 16px;
-    height: 16px;
-    margin: -5px 0;
-    border-radius: 8px;
-}
-
-QSlider::sub-page:horizontal {
-    background: #3b82f6;
-    border-radius: 3px;
-}
-
-QProgressBar {
-    background: #374151;
-    border: none;
-    border-radius: 4px;
-    height: 8px;
-    text-align: center;
-}
-
-QProgressBar::chunk {
-    background: #3b82f6;
-    border-radius: 4px;
-}
-
-QScrollBar:vertical {
-    background: #1f1f1f;
-    width: 12px;
-    border-radius: 6px;
-}
-
-QScrollBar::handle:vertical {
-    background: #4b5563;
-    border-radius: 6px;
-    min-height: 30px;
-}
-
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-    height: 0;
-}
-
-QScrollBar:horizontal {
-    background: #1f1f1f;
-    height: 12px;
-    border-radius: 6px;
-}
-
-QScrollBar::handle:horizontal {
-    background: #4b5563;
-    border-radius: 6px;
-    min-width: 30px;
-}
-
-QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-    width: 0;
-}
-
-QMessageBox {
-    background-color: #262626;
-}
-
-QMessageBox QLabel {
-    color: white;
-}
-
-QDialog {
-    background-color: #1a1a1a;
-}
-
-QSplitter::handle {
-    background: #333;
-}
-
-QSplitter::handle:horizontal {
-    width: 4px;
-}
-
-QSplitter::handle:vertical {
-    height: 4px;
-}
-
-QToolTip {
-    background-color: #262626;
-    color: white;
-    border: 1px solid #333;
-    border-radius: 4px;
-    padding: 4px 8px;
-}
-
-QLabel {
-    color: white;
-}
-"""
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "AI Dance Training\nLoading...",
+        Qt.AlignmentFlag.AlignCenter,
+        QColor(255, 255, 255),
+    )
+    return splash
 
 
 class DanceTrainingApp:
@@ -284,7 +84,16 @@ class DanceTrainingApp:
 
         # Apply dark theme
         self.app.setPalette(create_dark_palette())
-        self.app.setStyleSheet(DARK_STYLESHEET)
+        self.app.setStyleSheet(load_stylesheet("dark.qss"))
+
+        # Show a splash while the main window (and OpenCV/NumPy/workers
+        # behind it) is imported - keeps cold start visibly responsive
+        self.splash = create_splash_screen()
+        self.splash.show()
+        self.app.processEvents()
+
+        # Imported here, not at module level, so the splash appears first
+        from .ui.main_window import MainWindow
 
         # Create main window
         self.window = MainWindow()
@@ -292,6 +101,7 @@ class DanceTrainingApp:
     def run(self) -> int:
         """Run the application."""
         self.window.show()
+        self.splash.finish(self.window)
         return self.app.exec()
 
 
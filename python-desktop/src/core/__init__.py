@@ -2,6 +2,7 @@ from .pose_detector import PoseDetector
 from .pose_normalizer import PoseNormalizer, NormalizedPose
 from .scoring_engine import ScoringEngine, ScoreResult
 from .session_tracker import SessionTracker, SessionResult
+from .teacher_track import TeacherPoseTrack
 
 __all__ = [
     'PoseDetector',
@@ -11,4 +12,5 @@ __all__ = [
     'ScoreResult',
     'SessionTracker',
     'SessionResult',
+    'TeacherPoseTrack',
 ]
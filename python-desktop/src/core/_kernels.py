@@ -0,0 +1,209 @@
+"""
+Compiled numeric kernels for the per-frame pose math.
+
+Numba is optional: when it is installed the kernels below are compiled
+to machine code (and cached on disk), otherwise NUMBA_AVAILABLE is False
+and callers use their NumPy implementations instead.
+
+If the ahead-of-time build from build_kernels.py (_core_kernels) is
+present it is used in place of the JIT versions, which avoids the
+first-run compile and doesn't need Numba at runtime. It has to be
+rebuilt after editing this file; set DANCELEARN_NO_AOT=1 to ignore it.
+The @njit dispatchers keep their _jit_* names either way, which is what
+build_kernels.py compiles from.
+"""
+
+import math
+import os
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator so kernels stay importable without Numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Kernel signatures (shared with the AOT build in build_kernels.py)
+COMPUTE_ANGLES_SIG = "void(f4[:, ::1], i8[::1], i8[::1], i8[::1], f4[::1])"
+SCORE_ANGLES_SIG = "void(f4[::1], f4[::1], f4[::1], f4[:, ::1], i8[::1], f8, f8[::1])"
+FIND_WEAK_SECTIONS_SIG = "i8(f8[::1], u1[::1], f8, f8, f8, f8[::1], f8[::1], i8[::1], i8[::1])"
+CALIBRATION_CHECKS_SIG = "void(f4[:, ::1], i8[::1], f4, f4, f8[::1])"
+
+
+@njit(COMPUTE_ANGLES_SIG, cache=True, fastmath=True)
+def _jit_compute_angles(xy, parent, joint, child, out):
+    """
+    Write the angle at joint[k] formed by parent[k]-joint[k]-child[k]
+    into out[k] (radians) for every angle definition, in one pass.
+    """
+    for k in range(out.shape[0]):
+        jx = xy[joint[k], 0]
+        jy = xy[joint[k], 1]
+        v1x = xy[parent[k], 0] - jx
+        v1y = xy[parent[k], 1] - jy
+        v2x = xy[child[k], 0] - jx
+        v2y = xy[child[k], 1] - jy
+
+        # atan2(|cross|, dot): no sqrt/divide/clamp, and 0.0 for
+        # zero-length limbs since atan2(0, 0) == 0
+        cross = v1x * v2y - v1y * v2x
+        dot = v1x * v2x + v1y * v2y
+        out[k] = math.atan2(abs(cross), dot)
+
+
+@njit(SCORE_ANGLES_SIG, cache=True, fastmath=True)
+def _jit_score_angles(dancer, teacher, conf, lut, part_of, min_conf, out):
+    """
+    Fused per-frame scoring: for every angle k, wraparound diff, score
+    lookup in lut[k], confidence mask and squared weight, accumulated per
+    body part part_of[k]. Writes the weighted mean score of each part
+    into out (0.0 for parts without a confident angle).
+    """
+    bins = lut.shape[1]
+    scale = (bins - 1) / math.pi
+    weight_sums = np.zeros(out.shape[0])
+    out[:] = 0.0
+
+    for k in range(dancer.shape[0]):
+        c = conf[k]
+        if c < min_conf:
+            continue
+
+        diff = abs(dancer[k] - teacher[k])
+        if diff > math.pi:
+            diff = 2 * math.pi - diff
+        idx = min(int(diff * scale + 0.5), bins - 1)
+
+        w = c * c
+        out[part_of[k]] += lut[k, idx] * w
+        weight_sums[part_of[k]] += w
+
+    for p in range(out.shape[0]):
+        if weight_sums[p] > 0.0:
+            out[p] /= weight_sums[p]
+
+
+@njit(FIND_WEAK_SECTIONS_SIG, cache=True)
+def _jit_find_weak_sections(timestamps, scores, threshold, min_duration, merge_tolerance,
+                       starts, ends, sums, counts):
+    """
+    Scan a score timeline for runs below threshold. Runs separated by less
+    than merge_tolerance ms are merged; runs shorter than min_duration ms
+    are dropped. Writes each section's start/end timestamps and score
+    sum/count into the output arrays (sized len(scores)) and returns the
+    number of sections found.
+    """
+    found = 0
+    in_section = False
+    start = 0.0
+    end = 0.0
+    total = 0
+    count = 0
+
+    for i in range(scores.shape[0]):
+        t = timestamps[i]
+        score = scores[i]
+
+        if score < threshold:
+            if in_section and t - end < merge_tolerance:
+                # Close enough to merge
+                end = t
+                total += score
+                count += 1
+                continue
+
+            # Save current section if long enough, then start a new one
+            if in_section and end - start >= min_duration:
+                starts[found] = start
+                ends[found] = end
+                sums[found] = total
+                counts[found] = count
+                found += 1
+
+            in_section = True
+            start = t
+            end = t
+            total = score
+            count = 1
+
+        elif in_section:
+            if end - start >= min_duration:
+                starts[found] = start
+                ends[found] = end
+                sums[found] = total
+                counts[found] = count
+                found += 1
+            in_section = False
+
+    # Don't forget last section
+    if in_section and end - start >= min_duration:
+        starts[found] = start
+        ends[found] = end
+        sums[found] = total
+        counts[found] = count
+        found += 1
+
+    return found
+
+
+@njit(CALIBRATION_CHECKS_SIG, cache=True)
+def _jit_calibration_checks(landmarks, key_idx, vis_threshold, key_threshold, out):
+    """
+    Calibration pose checks in one pass over the (33, 4) landmarks. Writes
+    into out: [0] number of landmarks with visibility > vis_threshold,
+    [1] larger side of their x/y bounding box (0.0 when none are visible),
+    [2] number of key_idx landmarks with visibility > key_threshold.
+    """
+    visible = 0
+    # float32 bounds so the extent is rounded like the landmarks themselves
+    min_x = np.float32(np.inf)
+    max_x = np.float32(-np.inf)
+    min_y = np.float32(np.inf)
+    max_y = np.float32(-np.inf)
+
+    for i in range(landmarks.shape[0]):
+        if landmarks[i, 3] > vis_threshold:
+            visible += 1
+            x = landmarks[i, 0]
+            y = landmarks[i, 1]
+            min_x = min(min_x, x)
+            max_x = max(max_x, x)
+            min_y = min(min_y, y)
+            max_y = max(max_y, y)
+
+    key_vis = 0
+    for k in range(key_idx.shape[0]):
+        if landmarks[key_idx[k], 3] > key_threshold:
+            key_vis += 1
+
+    out[0] = visible
+    out[1] = max(max_x - min_x, max_y - min_y) if visible > 0 else 0.0
+    out[2] = key_vis
+
+
+# Public names; replaced below by the ahead-of-time build when present
+compute_angles = _jit_compute_angles
+score_angles = _jit_score_angles
+find_weak_sections = _jit_find_weak_sections
+calibration_checks = _jit_calibration_checks
+
+# Prefer the ahead-of-time compiled module when it has been built
+try:
+    if os.environ.get('DANCELEARN_NO_AOT'):
+        raise ImportError("AOT kernels disabled")
+    from . import _core_kernels
+except ImportError:
+    pass
+else:
+    compute_angles = _core_kernels.compute_angles
+    score_angles = _core_kernels.score_angles
+    find_weak_sections = _core_kernels.find_weak_sections
+    calibration_checks = _core_kernels.calibration_checks
+    NUMBA_AVAILABLE = True
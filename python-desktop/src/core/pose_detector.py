@@ -5,12 +5,16 @@ Extracts 33 pose landmarks from video frames with confidence scores.
 Supports both legacy (mp.solutions) and new MediaPipe APIs.
 """
 
+import os
+import threading
+import cv2
 import numpy as np
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Optional, List, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Keypoint:
     """Single pose keypoint with position and confidence."""
     x: float  # Normalized 0-1
@@ -23,16 +27,49 @@ class Keypoint:
         return int(self.x * width), int(self.y * height)
 
 
-@dataclass
+@dataclass(slots=True)
 class PoseResult:
     """Complete pose detection result."""
-    keypoints: List[Keypoint]
+    landmarks: np.ndarray  # (33, 4) float32: x, y, z, visibility per landmark
     timestamp_ms: float
+    _keypoints: Optional[List[Keypoint]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def x(self) -> np.ndarray:
+        """(33,) view of the normalized x positions."""
+        return self.landmarks[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """(33,) view of the normalized y positions."""
+        return self.landmarks[:, 1]
+
+    @property
+    def xy(self) -> np.ndarray:
+        """(33, 2) view of the normalized x/y positions."""
+        return self.landmarks[:, :2]
+
+    @property
+    def visibility(self) -> np.ndarray:
+        """(33,) view of the per-landmark confidence."""
+        return self.landmarks[:, 3]
+
+    @property
+    def keypoints(self) -> List[Keypoint]:
+        """Landmarks as Keypoint objects (built lazily, for UI code)."""
+        if self._keypoints is None:
+            self._keypoints = [
+                Keypoint(x=x, y=y, z=z, visibility=v)
+                for x, y, z, v in self.landmarks.tolist()
+            ]
+        return self._keypoints
 
     @property
     def is_valid(self) -> bool:
         """Check if pose has enough visible keypoints."""
-        visible_count = sum(1 for kp in self.keypoints if kp.visibility > 0.5)
+        visible_count = np.count_nonzero(self.visibility > 0.5)
         return visible_count >= 15  # At least half of major joints
 
 
@@ -77,23 +114,101 @@ class PoseDetector:
         (24, 26), (26, 28),
     ]
 
+    # Tasks-API model file for each model_complexity
+    MODEL_VARIANTS = ('lite', 'full', 'heavy')
+
     def __init__(
         self,
-        model_complexity: int = 1,
+        model_complexity: int = 0,
         min_detection_confidence: float = 0.5,
         min_tracking_confidence: float = 0.5,
+        use_gpu: bool = True,
+        use_async: bool = False,
+        max_input_size: int = 480,
+        detect_every: int = 1,
+        min_tracked_fraction: float = 0.5,
+        model_variant: Optional[str] = None,
+        model_path: Optional[str] = None,
     ):
         """
         Initialize pose detector.
 
         Args:
-            model_complexity: 0=Lite, 1=Full, 2=Heavy (accuracy vs speed)
+            model_complexity: 0=Lite, 1=Full, 2=Heavy (accuracy vs speed).
+                Lite is the default: it is ~3x faster than Full and the
+                accuracy difference is small at webcam resolution.
             min_detection_confidence: Minimum confidence for detection
             min_tracking_confidence: Minimum confidence for tracking
+            use_gpu: Use the GPU delegate when the tasks API supports it
+                (falls back to CPU if the GPU delegate can't be created)
+            use_async: Run the tasks API in LIVE_STREAM mode. detect() then
+                returns immediately with the most recent finished result
+                (last-known pose) instead of blocking on inference.
+                Optical-flow tracking (detect_every) is off in this mode.
+                The legacy solutions API has no LIVE_STREAM mode and
+                always detects synchronously.
+            max_input_size: Downscale frames so the longer side is at most
+                this many pixels before detection (0 = never). The model
+                input is 256px, so this doesn't affect accuracy.
+            detect_every: Run the model on every Nth frame only. Frames in
+                between move the previous landmarks with optical flow
+                (re-detecting if too few points could be tracked).
+                Ignored when LIVE_STREAM mode is in use (tasks API with
+                use_async), where the latest result belongs to an earlier
+                frame than the one flow would start from.
+            min_tracked_fraction: Re-detect when optical flow loses more
+                than this fraction of the visible landmarks
+            model_variant: Tasks-API model ('lite', 'full' or 'heavy');
+                defaults to the one matching model_complexity
+            model_path: Tasks-API model bundle (.task) to load instead of the
+                downloaded float16 one, e.g. an int8-quantized landmarker.
+                Always uses the tasks API (never the legacy solutions one);
+                raises if the file is missing or can't be loaded.
         """
         self._use_legacy = False
         self._pose = None
         self._landmarker = None
+        self.max_input_size = max_input_size
+        self._small_buf: Optional[np.ndarray] = None  # Reused downscale target
+        self._rgb_buf: Optional[np.ndarray] = None  # Reused BGR->RGB target
+
+        # Detect-then-track state
+        self.detect_every = max(1, detect_every)
+        self._min_tracked_fraction = min_tracked_fraction
+        self._frame_idx = 0
+        self._last_result: Optional[PoseResult] = None
+        self._prev_gray: Optional[np.ndarray] = None
+
+        # LIVE_STREAM state (tasks API only)
+        self._async = False
+        self._latest: deque = deque(maxlen=1)  # Latest PoseResult (or None)
+        self._last_async_ts = -1
+        # LIVE_STREAM needs strictly increasing timestamps, so the ones sent
+        # to MediaPipe are the caller's plus an offset that is rebased after
+        # reset(). Results are mapped back to the caller's timestamp.
+        self._ts_offset = 0
+        self._rebase_ts = False
+        self._pending_ts: dict = {}  # Sent timestamp -> caller's timestamp
+        self._pending_lock = threading.Lock()
+        self._has_visibility: Optional[bool] = None  # Probed on first tasks result
+
+        # A custom model bundle can only be loaded by the tasks API, so the
+        # legacy solutions API isn't tried for it
+        if model_path is not None:
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"Model not found: {model_path}")
+            try:
+                self._init_tasks(
+                    model_complexity, min_detection_confidence, min_tracking_confidence,
+                    use_gpu, use_async, model_variant, model_path,
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to load pose model {model_path} "
+                    f"(needs the MediaPipe tasks API)\n"
+                    f"Error: {e}"
+                )
+            return
 
         # Try new API first (mediapipe >= 0.10.8)
         try:
@@ -128,27 +243,10 @@ class PoseDetector:
             except AttributeError:
                 # Neither API works - try tasks API
                 try:
-                    import mediapipe as mp
-                    from mediapipe.tasks import python
-                    from mediapipe.tasks.python import vision
-                    import urllib.request
-                    import os
-
-                    # Download model if needed
-                    model_path = os.path.join(os.path.dirname(__file__), "pose_landmarker.task")
-                    if not os.path.exists(model_path):
-                        url = "https://storage.googleapis.com/mediapipe-models/pose_landmarker/pose_landmarker_lite/float16/1/pose_landmarker_lite.task"
-                        urllib.request.urlretrieve(url, model_path)
-
-                    base_options = python.BaseOptions(model_asset_path=model_path)
-                    options = vision.PoseLandmarkerOptions(
-                        base_options=base_options,
-                        running_mode=vision.RunningMode.IMAGE,
-                        min_pose_detection_confidence=min_detection_confidence,
-                        min_tracking_confidence=min_tracking_confidence,
+                    self._init_tasks(
+                        model_complexity, min_detection_confidence, min_tracking_confidence,
+                        use_gpu, use_async, model_variant, model_path,
                     )
-                    self._landmarker = vision.PoseLandmarker.create_from_options(options)
-                    self._use_legacy = False
                 except Exception as e:
                     raise RuntimeError(
                         f"Failed to initialize MediaPipe. "
@@ -156,6 +254,74 @@ class PoseDetector:
                         f"Error: {e}"
                     )
 
+    def _init_tasks(
+        self,
+        model_complexity: int,
+        min_detection_confidence: float,
+        min_tracking_confidence: float,
+        use_gpu: bool,
+        use_async: bool,
+        model_variant: Optional[str],
+        model_path: Optional[str],
+    ):
+        """Create the tasks-API PoseLandmarker (see __init__ for the arguments)."""
+        from mediapipe.tasks import python
+        from mediapipe.tasks.python import vision
+        import urllib.request
+
+        if model_path is None:
+            variant = model_variant or self.MODEL_VARIANTS[model_complexity]
+            if variant not in self.MODEL_VARIANTS:
+                raise ValueError(f"Unknown model variant: {variant}")
+
+            # Download model if needed
+            model_name = f"pose_landmarker_{variant}"
+            model_path = os.path.join(os.path.dirname(__file__), f"{model_name}.task")
+            if not os.path.exists(model_path):
+                url = f"https://storage.googleapis.com/mediapipe-models/pose_landmarker/{model_name}/float16/1/{model_name}.task"
+                urllib.request.urlretrieve(url, model_path)
+
+        def make_options(delegate):
+            return vision.PoseLandmarkerOptions(
+                base_options=python.BaseOptions(
+                    model_asset_path=model_path,
+                    delegate=delegate,
+                ),
+                running_mode=running_mode,
+                result_callback=result_callback,
+                min_pose_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence,
+            )
+
+        if use_async:
+            running_mode = vision.RunningMode.LIVE_STREAM
+            result_callback = self._on_async_result
+        else:
+            running_mode = vision.RunningMode.IMAGE
+            result_callback = None
+
+        cpu_delegate = python.BaseOptions.Delegate.CPU
+        gpu_delegate = getattr(python.BaseOptions.Delegate, 'GPU', None)
+
+        if use_gpu and gpu_delegate is not None:
+            try:
+                self._landmarker = vision.PoseLandmarker.create_from_options(
+                    make_options(gpu_delegate)
+                )
+            except Exception:
+                # No usable GPU (or unsupported platform) - use CPU
+                self._landmarker = vision.PoseLandmarker.create_from_options(
+                    make_options(cpu_delegate)
+                )
+        else:
+            self._landmarker = vision.PoseLandmarker.create_from_options(
+                make_options(cpu_delegate)
+            )
+        self._use_legacy = False
+        self._async = use_async
+        if use_async:
+            self.detect_every = 1
+
     def detect(self, frame: np.ndarray, timestamp_ms: float = 0) -> Optional[PoseResult]:
         """
         Detect pose in a BGR frame.
@@ -165,10 +331,54 @@ class PoseDetector:
             timestamp_ms: Frame timestamp in milliseconds
 
         Returns:
-            PoseResult if pose detected, None otherwise
+            PoseResult if pose detected, None otherwise. With use_async this
+            is the most recent finished result, which may lag a frame or two.
+        """
+        # Landmarks are normalized 0-1, so detecting on a smaller copy
+        # gives the same coordinates for less conversion/resize work
+        frame = self._downscale(frame)
+
+        if self.detect_every == 1:
+            return self._run_model(frame, timestamp_ms)
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        result = None
+
+        # Between model runs, carry the last pose forward with optical flow
+        if self._frame_idx % self.detect_every != 0:
+            result = self._track(gray, timestamp_ms)
+
+        if result is None:
+            result = self._run_model(frame, timestamp_ms)
+
+        self._frame_idx += 1
+        self._last_result = result
+        self._prev_gray = gray
+        return result
+
+    def reset(self):
+        """
+        Forget the previous pose, e.g. after the video was seeked. Results
+        still in flight in LIVE_STREAM mode are discarded.
         """
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = frame[:, :, ::-1].copy()
+        self._frame_idx = 0
+        self._last_result = None
+        self._prev_gray = None
+        self._rebase_ts = True
+        with self._pending_lock:
+            self._pending_ts.clear()
+            self._latest.clear()
+
+    def _run_model(self, frame: np.ndarray, timestamp_ms: float) -> Optional[PoseResult]:
+        """Run MediaPipe on a (downscaled) BGR frame."""
+        if self._async:
+            return self._detect_async(frame, timestamp_ms)
+
+        # Convert BGR to RGB for MediaPipe into a buffer reused across frames
+        # (reallocated only when the resolution changes)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
 
         if self._use_legacy and self._pose:
             # Legacy API (mp.solutions.pose)
@@ -177,16 +387,15 @@ class PoseDetector:
             if not results.pose_landmarks:
                 return None
 
-            keypoints = []
-            for landmark in results.pose_landmarks.landmark:
-                keypoints.append(Keypoint(
-                    x=landmark.x,
-                    y=landmark.y,
-                    z=landmark.z,
-                    visibility=landmark.visibility,
-                ))
+            landmarks = np.array(
+                [
+                    (landmark.x, landmark.y, landmark.z, landmark.visibility)
+                    for landmark in results.pose_landmarks.landmark
+                ],
+                dtype=np.float32,
+            )
 
-            return PoseResult(keypoints=keypoints, timestamp_ms=timestamp_ms)
+            return PoseResult(landmarks=landmarks, timestamp_ms=timestamp_ms)
 
         elif self._landmarker:
             # Tasks API (mediapipe.tasks)
@@ -194,23 +403,109 @@ class PoseDetector:
 
             mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
             results = self._landmarker.detect(mp_image)
-
-            if not results.pose_landmarks or len(results.pose_landmarks) == 0:
-                return None
-
-            keypoints = []
-            for landmark in results.pose_landmarks[0]:
-                keypoints.append(Keypoint(
-                    x=landmark.x,
-                    y=landmark.y,
-                    z=landmark.z,
-                    visibility=landmark.visibility if hasattr(landmark, 'visibility') else 1.0,
-                ))
-
-            return PoseResult(keypoints=keypoints, timestamp_ms=timestamp_ms)
+            return self._tasks_result_to_pose(results, timestamp_ms)
 
         return None
 
+    def _track(self, gray: np.ndarray, timestamp_ms: float) -> Optional[PoseResult]:
+        """
+        Move the last landmarks to the current frame with Lucas-Kanade
+        optical flow. Returns None when a full detection is needed instead.
+        """
+        last = self._last_result
+        prev_gray = self._prev_gray
+        if last is None or prev_gray is None or prev_gray.shape != gray.shape:
+            return None
+        if not last.is_valid:
+            return None
+
+        height, width = gray.shape
+        size = np.array([width, height], dtype=np.float32)
+        prev_pts = (last.xy * size).reshape(-1, 1, 2)
+
+        next_pts, status, _ = cv2.calcOpticalFlowPyrLK(
+            prev_gray, gray, prev_pts, None, winSize=(15, 15), maxLevel=2
+        )
+        if next_pts is None:
+            return None
+
+        # Too many visible points lost - re-detect
+        tracked = status.reshape(-1).astype(bool)
+        visible = last.visibility > 0.5
+        if np.count_nonzero(tracked & visible) < self._min_tracked_fraction * np.count_nonzero(visible):
+            return None
+
+        landmarks = last.landmarks.copy()
+        landmarks[tracked, :2] = next_pts.reshape(-1, 2)[tracked] / size
+        return PoseResult(landmarks=landmarks, timestamp_ms=timestamp_ms)
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Shrink frame (keeping aspect ratio) to at most max_input_size."""
+        height, width = frame.shape[:2]
+        long_side = max(height, width)
+        if not self.max_input_size or long_side <= self.max_input_size:
+            return frame
+
+        scale = self.max_input_size / long_side
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        if self._small_buf is None or self._small_buf.shape[:2] != (size[1], size[0]):
+            self._small_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        return cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+
+    def _detect_async(self, frame: np.ndarray, timestamp_ms: float) -> Optional[PoseResult]:
+        """Submit a frame in LIVE_STREAM mode and return the latest result."""
+        import mediapipe as mp
+
+        # MediaPipe may still be reading the image after detect_async
+        # returns, so it gets its own buffer instead of the shared one
+        mp_image = mp.Image(
+            image_format=mp.ImageFormat.SRGB,
+            data=cv2.cvtColor(frame, cv2.COLOR_BGR2RGB),
+        )
+        # LIVE_STREAM requires strictly increasing timestamps. After a
+        # reset (e.g. a backward seek) the offset is rebased so they keep
+        # increasing at the same spacing as the caller's
+        if self._rebase_ts:
+            self._ts_offset = self._last_async_ts + 1 - int(timestamp_ms)
+            self._rebase_ts = False
+        ts = max(int(timestamp_ms) + self._ts_offset, self._last_async_ts + 1)
+        self._last_async_ts = ts
+        with self._pending_lock:
+            self._pending_ts[ts] = timestamp_ms
+        self._landmarker.detect_async(mp_image, ts)
+        return self._latest[-1] if self._latest else None
+
+    def _on_async_result(self, results, output_image, timestamp_ms: int):
+        """LIVE_STREAM result callback (runs on a MediaPipe thread)."""
+        with self._pending_lock:
+            caller_ts = self._pending_ts.pop(timestamp_ms, None)
+            if caller_ts is None:
+                return  # Sent before reset()
+            # Results arrive in order; earlier frames were skipped by MediaPipe
+            for ts in [t for t in self._pending_ts if t < timestamp_ms]:
+                del self._pending_ts[ts]
+            self._latest.append(self._tasks_result_to_pose(results, caller_ts))
+
+    def _tasks_result_to_pose(self, results, timestamp_ms: float) -> Optional[PoseResult]:
+        """Convert a tasks-API PoseLandmarkerResult to a PoseResult."""
+        if not results.pose_landmarks or len(results.pose_landmarks) == 0:
+            return None
+
+        pose_landmarks = results.pose_landmarks[0]
+
+        # Whether this MediaPipe build reports visibility is probed once,
+        # on the first result, instead of per landmark
+        if self._has_visibility is None:
+            self._has_visibility = getattr(pose_landmarks[0], 'visibility', None) is not None
+
+        if self._has_visibility:
+            rows = [(lm.x, lm.y, lm.z, lm.visibility) for lm in pose_landmarks]
+        else:
+            rows = [(lm.x, lm.y, lm.z, 1.0) for lm in pose_landmarks]
+
+        landmarks = np.array(rows, dtype=np.float32)
+        return PoseResult(landmarks=landmarks, timestamp_ms=timestamp_ms)
+
     def close(self):
         """Release resources."""
         if self._pose:
@@ -9,7 +9,8 @@ import math
 import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Optional
-from .pose_detector import PoseResult, Keypoint
+from .pose_detector import PoseResult
+from ._kernels import NUMBA_AVAILABLE, compute_angles
 
 
 # MediaPipe Pose landmark indices
@@ -46,6 +47,11 @@ ANGLE_DEFINITIONS = [
     (LANDMARKS.RIGHT_SHOULDER, LANDMARKS.RIGHT_HIP, LANDMARKS.LEFT_SHOULDER),
 ]
 
+# Index arrays for vectorized angle calculation (derived from ANGLE_DEFINITIONS)
+JOINT_IDX = np.array([joint for joint, _, _ in ANGLE_DEFINITIONS], dtype=np.int64)
+PARENT_IDX = np.array([parent for _, parent, _ in ANGLE_DEFINITIONS], dtype=np.int64)
+CHILD_IDX = np.array([child for _, _, child in ANGLE_DEFINITIONS], dtype=np.int64)
+
 # Relevant keypoint indices for confidence calculation
 RELEVANT_INDICES = [
     LANDMARKS.LEFT_SHOULDER,
@@ -61,19 +67,26 @@ RELEVANT_INDICES = [
     LANDMARKS.LEFT_ANKLE,
     LANDMARKS.RIGHT_ANKLE,
 ]
+RELEVANT_IDX = np.array(RELEVANT_INDICES, dtype=np.int64)
+
+# Hip and shoulder pairs, gathered in one indexing op for center and scale
+TORSO_IDX = np.array([
+    LANDMARKS.LEFT_HIP, LANDMARKS.RIGHT_HIP,
+    LANDMARKS.LEFT_SHOULDER, LANDMARKS.RIGHT_SHOULDER,
+], dtype=np.int64)
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedPose:
     """Normalized pose with angles and confidence - matches web version."""
-    angles: List[float]  # 10 angles in radians
-    confidence: List[float]  # 12 confidence values
+    angles: np.ndarray  # 10 angles in radians
+    confidence: np.ndarray  # 12 confidence values
     center_x: float
     center_y: float
     scale: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BodyPartAngles:
     """Body part angles grouped."""
     arms: List[float]  # indices 0-3
@@ -93,59 +106,54 @@ class PoseNormalizer:
             smoothing_factor: 0-1, higher = more smoothing (desktop enhancement)
         """
         self.smoothing_factor = smoothing_factor
-        self._prev_angles: Optional[List[float]] = None
+        self._prev_angles: Optional[np.ndarray] = None
+        self._angles_buf = np.empty(len(ANGLE_DEFINITIONS), dtype=np.float32)
 
-    def _calculate_angle(self, p1: Keypoint, p2: Keypoint, p3: Keypoint) -> float:
+    def calculate_angles(self, xy: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        Calculate angle at p2 formed by p1-p2-p3.
-        Returns angle in radians (matches web version).
+        Calculate all 10 joint angles from a (33, 2) array of x/y positions.
+        Angle at joint formed by parent-joint-child, in radians (matches web version).
+
+        Args:
+            xy: Landmark positions
+            out: Optional float32 buffer of length 10 to write into
         """
-        v1_x = p1.x - p2.x
-        v1_y = p1.y - p2.y
-        v2_x = p3.x - p2.x
-        v2_y = p3.y - p2.y
-
-        dot = v1_x * v2_x + v1_y * v2_y
-        mag1 = math.sqrt(v1_x * v1_x + v1_y * v1_y)
-        mag2 = math.sqrt(v2_x * v2_x + v2_y * v2_y)
-
-        if mag1 == 0 or mag2 == 0:
-            return 0.0
-
-        cos_angle = max(-1.0, min(1.0, dot / (mag1 * mag2)))
-        return math.acos(cos_angle)
-
-    def calculate_angles(self, keypoints: List[Keypoint]) -> List[float]:
-        """Calculate all 10 joint angles."""
-        angles = []
-        for joint, parent, child in ANGLE_DEFINITIONS:
-            p1 = keypoints[parent]
-            p2 = keypoints[joint]
-            p3 = keypoints[child]
-            angle = self._calculate_angle(p1, p2, p3)
-            angles.append(angle)
-        return angles
-
-    def calculate_confidence(self, keypoints: List[Keypoint]) -> List[float]:
-        """Get confidence for relevant keypoints."""
-        return [keypoints[idx].visibility for idx in RELEVANT_INDICES]
-
-    def _smooth_angles(self, angles: List[float]) -> List[float]:
+        if NUMBA_AVAILABLE:
+            if out is None:
+                out = np.empty(len(JOINT_IDX), dtype=np.float32)
+            compute_angles(
+                np.ascontiguousarray(xy, dtype=np.float32),
+                PARENT_IDX, JOINT_IDX, CHILD_IDX, out,
+            )
+            return out
+
+        joints = xy[JOINT_IDX]
+        v1 = xy[PARENT_IDX] - joints
+        v2 = xy[CHILD_IDX] - joints
+
+        # Unsigned angle = atan2(|v1 x v2|, v1 . v2): no normalization or
+        # clamping needed, and degenerate (zero-length) limbs give 0.0
+        cross = v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]
+        dot = v1[:, 0] * v2[:, 0] + v1[:, 1] * v2[:, 1]
+        return np.arctan2(np.abs(cross), dot, out=out)
+
+    def calculate_confidence(self, visibility: np.ndarray) -> np.ndarray:
+        """Get confidence for relevant keypoints from the (33,) visibility array."""
+        return visibility[RELEVANT_IDX]
+
+    def _smooth_angles(self, angles: np.ndarray) -> np.ndarray:
         """Apply exponential smoothing for smoother skeleton (desktop enhancement)."""
         if self._prev_angles is None:
-            self._prev_angles = angles.copy()
-            return angles
-
-        smoothed = []
-        for i, angle in enumerate(angles):
-            smoothed_angle = (
-                self.smoothing_factor * self._prev_angles[i] +
-                (1 - self.smoothing_factor) * angle
-            )
-            smoothed.append(smoothed_angle)
+            self._prev_angles = angles.astype(np.float32)
+            return self._prev_angles.copy()
 
-        self._prev_angles = smoothed.copy()
-        return smoothed
+        # EMA in place on the state buffer: prev = s * prev + (1 - s) * new
+        s = self.smoothing_factor
+        np.multiply(self._prev_angles, s, out=self._prev_angles)
+        self._prev_angles += (1.0 - s) * angles
+
+        # Return a copy - the state buffer keeps changing every frame
+        return self._prev_angles.copy()
 
     def normalize(
         self,
@@ -167,41 +175,34 @@ class PoseNormalizer:
         if not pose.is_valid:
             return None
 
-        keypoints = pose.keypoints
+        xy = pose.xy
 
-        # Mirror keypoints if needed (matches web version)
-        if mirror:
-            keypoints = [
-                Keypoint(x=1 - kp.x, y=kp.y, z=kp.z, visibility=kp.visibility)
-                for kp in keypoints
-            ]
-
-        # Calculate center (hip midpoint)
-        left_hip = keypoints[LANDMARKS.LEFT_HIP]
-        right_hip = keypoints[LANDMARKS.RIGHT_HIP]
-        center_x = (left_hip.x + right_hip.x) / 2
-        center_y = (left_hip.y + right_hip.y) / 2
-
-        # Calculate torso length for scale
-        left_shoulder = keypoints[LANDMARKS.LEFT_SHOULDER]
-        right_shoulder = keypoints[LANDMARKS.RIGHT_SHOULDER]
-        shoulder_center_x = (left_shoulder.x + right_shoulder.x) / 2
-        shoulder_center_y = (left_shoulder.y + right_shoulder.y) / 2
-
-        torso_length = math.sqrt(
-            (shoulder_center_x - center_x) ** 2 +
-            (shoulder_center_y - center_y) ** 2
-        )
+        # Hip (center) and shoulder midpoints in one step, in float64 like
+        # the per-keypoint math this replaces
+        hip_mid, shoulder_mid = xy[TORSO_IDX].astype(np.float64).reshape(2, 2, 2).sum(axis=1) / 2
+
+        # Torso length for scale (unaffected by mirroring)
+        torso = shoulder_mid - hip_mid
+        torso_length = math.sqrt(torso.dot(torso))
         scale = torso_length if torso_length > 0 else 1.0
 
+        # Mirror if needed (matches web version). Joint angles and torso
+        # length don't change under a horizontal flip, so only the center
+        # has to be mirrored - no flipped copy of the keypoints needed.
+        center_x, center_y = hip_mid.tolist()
+        if mirror:
+            center_x = 1.0 - center_x
+
         # Calculate angles
-        angles = self.calculate_angles(keypoints)
+        angles = self.calculate_angles(xy, out=self._angles_buf)
 
         # Apply smoothing for desktop (makes skeleton movement smoother)
         if apply_smoothing:
             angles = self._smooth_angles(angles)
+        else:
+            angles = angles.copy()  # Don't hand out the scratch buffer
 
-        confidence = self.calculate_confidence(keypoints)
+        confidence = self.calculate_confidence(pose.visibility)
 
         return NormalizedPose(
             angles=angles,
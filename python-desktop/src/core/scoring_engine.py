@@ -5,9 +5,11 @@ Compares dancer pose vs teacher pose and calculates scores.
 """
 
 import math
+import numpy as np
 from dataclasses import dataclass
 from typing import List, Optional
 from .pose_normalizer import NormalizedPose, BodyPartAngles, get_body_part_angles
+from ._kernels import NUMBA_AVAILABLE, score_angles
 
 
 # Weights for each body part - matches web version
@@ -20,6 +22,9 @@ ANGLE_WEIGHTS = {
 # Minimum confidence threshold for scoring
 MIN_CONFIDENCE_THRESHOLD = 0.65
 
+# Body parts scoring at or above this don't get a hint
+HINT_SCORE_THRESHOLD = 80
+
 # Tolerance windows in radians (converted from degrees)
 TOLERANCE_WINDOWS = {
     'arms': 25 * (math.pi / 180),   # 25 degrees
@@ -28,7 +33,7 @@ TOLERANCE_WINDOWS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class BodyPartScores:
     """Scores for each body part."""
     arms: int
@@ -36,7 +41,7 @@ class BodyPartScores:
     torso: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreResult:
     """Complete score result for a frame."""
     overall_score: int
@@ -53,22 +58,38 @@ def angle_difference(a1: float, a2: float) -> float:
     return diff
 
 
-def calculate_angle_score(diff: float, tolerance: float) -> float:
+def calculate_angle_score(diff, tolerance: float):
     """
     Non-linear scoring: small errors = minimal penalty, large errors = heavy penalty.
     Matches web version exactly.
+
+    Branchless: both pieces are evaluated and blended with a mask, so diff
+    may be a float or an array of diffs (returns the same kind).
     """
-    if diff <= tolerance:
-        # Within tolerance: score 85-100 (small linear penalty)
-        return 100 - (diff / tolerance) * 15
+    diff = np.asarray(diff, dtype=np.float64)
 
-    # Outside tolerance: exponential penalty
-    excess_diff = diff - tolerance
-    max_excess = math.pi - tolerance
-    ratio = min(excess_diff / max_excess, 1)
+    # Within tolerance: score 85-100 (small linear penalty)
+    in_score = 100 - (diff / tolerance) * 15
 
+    # Outside tolerance: exponential penalty
     # Exponential curve: starts at 85, drops faster as error increases
-    return max(0, 85 * pow(1 - ratio, 1.5))
+    ratio = np.minimum((diff - tolerance) / (math.pi - tolerance), 1.0)
+    out_score = 85 * np.power(np.maximum(1 - ratio, 0.0), 1.5)
+
+    score = np.where(diff <= tolerance, in_score, out_score)
+    return score if score.ndim else float(score)
+
+
+# Precomputed angle scores: diff in [0, pi] quantized to SCORE_LUT_BINS bins
+# per body part, so scoring an angle is an index + load instead of pow()
+SCORE_LUT_BINS = 1024
+_SCORE_LUT_SCALE = (SCORE_LUT_BINS - 1) / math.pi
+_SCORE_LUT = {
+    part: calculate_angle_score(
+        np.linspace(0.0, math.pi, SCORE_LUT_BINS), tolerance
+    ).astype(np.float32)
+    for part, tolerance in TOLERANCE_WINDOWS.items()
+}
 
 
 def calculate_body_part_score(
@@ -78,27 +99,81 @@ def calculate_body_part_score(
     body_part: str,
 ) -> float:
     """Calculate score for a body part."""
-    if not dancer_angles or not teacher_angles:
+    if len(dancer_angles) == 0 or len(teacher_angles) == 0:
         return 0.0
 
-    tolerance = TOLERANCE_WINDOWS[body_part]
-    total_score = 0.0
-    valid_count = 0.0
+    dancer = np.asarray(dancer_angles, dtype=np.float32)
+    teacher = np.asarray(teacher_angles, dtype=np.float32)
+
+    # Missing confidence values count as fully confident
+    conf = np.ones(len(dancer), dtype=np.float32)
+    n = min(len(confidence), len(dancer))
+    conf[:n] = confidence[:n]
+
+    # Angle difference with wraparound, then LUT lookup (nearest bin)
+    diff = np.abs(dancer - teacher)
+    diff = np.minimum(diff, 2 * math.pi - diff)
+    idx = np.minimum(diff * _SCORE_LUT_SCALE + 0.5, SCORE_LUT_BINS - 1).astype(np.int32)
+    scores = _SCORE_LUT[body_part][idx]
+
+    # Weight by confidence squared (low confidence = much less impact),
+    # skipping angles below the confidence threshold
+    weights = np.where(conf >= MIN_CONFIDENCE_THRESHOLD, conf * conf, 0.0)
+    valid_count = weights.sum()
+
+    return float(np.dot(scores, weights) / valid_count) if valid_count > 0 else 0.0
+
+
+# Body part of each of the 10 angles (see ANGLE_DEFINITIONS) and the index
+# where each part's run of angles starts: arms 0-3, legs 4-7, torso 8-9
+_ANGLE_PARTS = ('arms',) * 4 + ('legs',) * 4 + ('torso',) * 2
+_PART_STARTS = np.array([0, 4, 8])
+_ANGLE_LUT = np.stack([_SCORE_LUT[part] for part in _ANGLE_PARTS])
+_ANGLE_ROWS = np.arange(len(_ANGLE_PARTS))
+_ANGLE_PART_IDX = np.searchsorted(_PART_STARTS, _ANGLE_ROWS, side='right') - 1  # 0=arms, 1=legs, 2=torso
 
-    for i in range(len(dancer_angles)):
-        conf = confidence[i] if i < len(confidence) else 1.0
-        if conf < MIN_CONFIDENCE_THRESHOLD:
-            continue
 
-        diff = angle_difference(dancer_angles[i], teacher_angles[i])
-        score = calculate_angle_score(diff, tolerance)
+def calculate_body_part_scores(
+    dancer_angles: np.ndarray,
+    teacher_angles: np.ndarray,
+    confidence: List[float],
+) -> np.ndarray:
+    """
+    Score arms, legs and torso in one pass over all 10 angles.
+    Same result as calculate_body_part_score for each part.
+
+    Returns:
+        Array of 3 scores: arms, legs, torso
+    """
+    n = len(_ANGLE_PARTS)
+    dancer = np.ascontiguousarray(dancer_angles[:n], dtype=np.float32)
+    teacher = np.ascontiguousarray(teacher_angles[:n], dtype=np.float32)
+    conf = np.ascontiguousarray(confidence[:n], dtype=np.float32)
+
+    if NUMBA_AVAILABLE:
+        # Whole pipeline below in one compiled call
+        out = np.empty(len(_PART_STARTS))
+        score_angles(
+            dancer, teacher, conf, _ANGLE_LUT, _ANGLE_PART_IDX,
+            MIN_CONFIDENCE_THRESHOLD, out,
+        )
+        return out
+
+    diff = np.abs(dancer - teacher)
+    diff = np.minimum(diff, 2 * math.pi - diff)
+    idx = np.minimum(diff * _SCORE_LUT_SCALE + 0.5, SCORE_LUT_BINS - 1).astype(np.int32)
+    scores = _ANGLE_LUT[_ANGLE_ROWS, idx]
 
-        # Weight by confidence squared (low confidence = much less impact)
-        conf_weight = conf * conf
-        total_score += score * conf_weight
-        valid_count += conf_weight
+    # Confidence mask instead of a branch, weighted by confidence squared
+    weights = np.where(conf >= MIN_CONFIDENCE_THRESHOLD, conf * conf, 0.0)
+    totals = np.add.reduceat(scores * weights, _PART_STARTS)
+    valid_counts = np.add.reduceat(weights, _PART_STARTS)
 
-    return total_score / valid_count if valid_count > 0 else 0.0
+    return np.divide(
+        totals, valid_counts,
+        out=np.zeros(len(_PART_STARTS)),
+        where=valid_counts > 0,
+    )
 
 
 def generate_hint(
@@ -117,7 +192,7 @@ def generate_hint(
 
     weakest_part, weakest_score = min(scores, key=lambda x: x[1])
 
-    if weakest_score >= 80:
+    if weakest_score >= HINT_SCORE_THRESHOLD:
         return None
 
     if weakest_part == 'arms':
@@ -176,19 +251,9 @@ class ScoringEngine:
         Compare dancer and teacher poses, return score result.
         Matches web version logic.
         """
-        dancer_parts = get_body_part_angles(dancer_pose.angles)
-        teacher_parts = get_body_part_angles(teacher_pose.angles)
-        conf_parts = get_body_part_angles(dancer_pose.confidence)
-
-        arms_score = calculate_body_part_score(
-            dancer_parts.arms, teacher_parts.arms, conf_parts.arms, 'arms'
-        )
-        legs_score = calculate_body_part_score(
-            dancer_parts.legs, teacher_parts.legs, conf_parts.legs, 'legs'
-        )
-        torso_score = calculate_body_part_score(
-            dancer_parts.torso, teacher_parts.torso, conf_parts.torso, 'torso'
-        )
+        arms_score, legs_score, torso_score = calculate_body_part_scores(
+            dancer_pose.angles, teacher_pose.angles, dancer_pose.confidence
+        ).tolist()
 
         overall_score = round(
             arms_score * ANGLE_WEIGHTS['arms'] +
@@ -196,10 +261,15 @@ class ScoringEngine:
             torso_score * ANGLE_WEIGHTS['torso']
         )
 
-        hint = generate_hint(
-            arms_score, legs_score, torso_score,
-            dancer_parts, teacher_parts
-        )
+        # Hints need the per-part angles; skip building them when every
+        # part scores well enough that there is no hint to give
+        hint = None
+        if min(arms_score, legs_score, torso_score) < HINT_SCORE_THRESHOLD:
+            hint = generate_hint(
+                arms_score, legs_score, torso_score,
+                get_body_part_angles(dancer_pose.angles),
+                get_body_part_angles(teacher_pose.angles),
+            )
 
         result = ScoreResult(
             overall_score=overall_score,
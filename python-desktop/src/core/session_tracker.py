@@ -4,13 +4,25 @@ Session Tracker - Track scores over time and generate session reports.
 Matches web version SessionScorer logic.
 """
 
+import bisect
+import heapq
+import numpy as np
+from operator import attrgetter
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Sequence
 from .scoring_engine import ScoreResult, BodyPartScores
 from .pose_normalizer import NormalizedPose
+from ._kernels import NUMBA_AVAILABLE, find_weak_sections
 
 
-@dataclass
+# Grade lookup: the lowest score for each grade above F, and the grades
+# (F first) that bisect_right over those thresholds indexes into
+_GRADE_THRESHOLDS = (50, 55, 60, 65, 70, 75, 80, 85, 90, 95)
+_GRADES = ('F', 'D', 'C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+')
+_GRADES_ARR = np.array(_GRADES, dtype=object)
+
+
+@dataclass(slots=True)
 class WeakSection:
     """A section where the dancer struggled."""
     start_ms: float
@@ -18,7 +30,7 @@ class WeakSection:
     score: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreEntry:
     """Single score entry with timestamp."""
     timestamp_ms: float
@@ -26,13 +38,60 @@ class ScoreEntry:
     body_parts: BodyPartScores
 
 
-@dataclass
+class _ScoreTimelineView(Sequence):
+    """
+    Read-only sequence of ScoreEntry over score column arrays.
+    Entries are built on access, so consumers only pay for what they touch.
+    """
+
+    __slots__ = ('_timestamps', '_overall', '_arms', '_legs', '_torso')
+
+    def __init__(self, timestamps, overall, arms, legs, torso):
+        self._timestamps = timestamps
+        self._overall = overall
+        self._arms = arms
+        self._legs = legs
+        self._torso = torso
+
+    def _columns(self):
+        return self._timestamps, self._overall, self._arms, self._legs, self._torso
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _ScoreTimelineView(*(column[index] for column in self._columns()))
+        return ScoreEntry(
+            timestamp_ms=float(self._timestamps[index]),
+            score=int(self._overall[index]),
+            body_parts=BodyPartScores(
+                arms=int(self._arms[index]),
+                legs=int(self._legs[index]),
+                torso=int(self._torso[index]),
+            ),
+        )
+
+    def __iter__(self) -> Iterator[ScoreEntry]:
+        columns = (column.tolist() for column in self._columns())
+        for timestamp_ms, score, arms, legs, torso in zip(*columns):
+            yield ScoreEntry(
+                timestamp_ms=timestamp_ms,
+                score=score,
+                body_parts=BodyPartScores(arms=arms, legs=legs, torso=torso),
+            )
+
+    def __repr__(self) -> str:
+        return f"<score timeline: {len(self)} entries>"
+
+
+@dataclass(slots=True)
 class SessionResult:
     """Complete session analysis."""
     overall_score: int
     avg_timing_ms: float
     body_parts: BodyPartScores
-    score_timeline: List[ScoreEntry]
+    score_timeline: Sequence[ScoreEntry]
     weak_sections: List[WeakSection]
     duration_ms: float
     grade: str
@@ -40,28 +99,12 @@ class SessionResult:
     @staticmethod
     def calculate_grade(score: int) -> str:
         """Convert score to letter grade."""
-        if score >= 95:
-            return 'A+'
-        elif score >= 90:
-            return 'A'
-        elif score >= 85:
-            return 'A-'
-        elif score >= 80:
-            return 'B+'
-        elif score >= 75:
-            return 'B'
-        elif score >= 70:
-            return 'B-'
-        elif score >= 65:
-            return 'C+'
-        elif score >= 60:
-            return 'C'
-        elif score >= 55:
-            return 'C-'
-        elif score >= 50:
-            return 'D'
-        else:
-            return 'F'
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, score)]
+
+    @staticmethod
+    def calculate_grades(scores: np.ndarray) -> np.ndarray:
+        """Convert an array of scores to an array of letter grades."""
+        return _GRADES_ARR[np.searchsorted(_GRADE_THRESHOLDS, scores, side='right')]
 
 
 class SessionTracker:
@@ -70,50 +113,147 @@ class SessionTracker:
     Matches web version SessionScorer logic.
     """
 
+    # Initial number of score slots; buffers double when full (like list)
+    INITIAL_CAPACITY = 1024
+
+    # Weak sections: scores below WEAK_THRESHOLD for at least
+    # WEAK_MIN_DURATION_MS, merging runs within WEAK_MERGE_TOLERANCE_MS
+    WEAK_THRESHOLD = 60
+    WEAK_MIN_DURATION_MS = 500
+    WEAK_MERGE_TOLERANCE_MS = 1000
+
     def __init__(self):
-        self.scores: List[ScoreEntry] = []
-        self.teacher_poses: Dict[int, NormalizedPose] = {}
+        # Scores stored column-wise (one array per field) instead of a
+        # ScoreEntry per frame; only the first _count slots are valid.
+        # Scores are 0-100 so a byte each; timestamps stay float64 to keep
+        # sub-ms precision over long sessions
+        self._count = 0
+        self._timestamps = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._overall = np.empty(self.INITIAL_CAPACITY, dtype=np.uint8)
+        self._arms = np.empty(self.INITIAL_CAPACITY, dtype=np.uint8)
+        self._legs = np.empty(self.INITIAL_CAPACITY, dtype=np.uint8)
+        self._torso = np.empty(self.INITIAL_CAPACITY, dtype=np.uint8)
+
+        # Running totals so the averages don't need a pass over all scores
+        self._sum_score = 0
+        self._sum_arms = 0
+        self._sum_legs = 0
+        self._sum_torso = 0
+
+        # Teacher poses as sorted (rounded) timestamps plus the poses in the
+        # same order - lookups binary-search the timestamp array
+        self._teacher_ts = np.empty(0, dtype=np.int64)
+        self._teacher_pose_list: List[NormalizedPose] = []
+        # One-slot memo: consecutive frames often round to the same ms
+        self._last_rounded: Optional[int] = None
+        self._last_teacher_pose: Optional[NormalizedPose] = None
         self.start_time_ms: float = 0
 
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def scores(self) -> Sequence[ScoreEntry]:
+        """Recorded scores as a read-only sequence of ScoreEntry."""
+        # Snapshot - later add_score/reset must not change a returned timeline
+        n = self._count
+        return _ScoreTimelineView(
+            self._timestamps[:n].copy(),
+            self._overall[:n].copy(),
+            self._arms[:n].copy(),
+            self._legs[:n].copy(),
+            self._torso[:n].copy(),
+        )
+
     def set_teacher_poses(self, poses: Dict[float, NormalizedPose]):
         """Pre-load teacher poses for timestamp lookup."""
-        self.teacher_poses.clear()
-        for timestamp, pose in poses.items():
-            self.teacher_poses[round(timestamp)] = pose
+        # Round first (half up, as in find_teacher_pose) so that timestamps
+        # landing on the same ms keep the last pose
+        by_ms = {
+            int(timestamp + 0.5) if timestamp >= 0 else -int(0.5 - timestamp): pose
+            for timestamp, pose in poses.items()
+        }
+
+        self._teacher_ts = np.array(sorted(by_ms), dtype=np.int64)
+        self._teacher_pose_list = [by_ms[t] for t in self._teacher_ts.tolist()]
+        self._last_rounded = None
+        self._last_teacher_pose = None
+
+    def reserve(self, capacity: int):
+        """
+        Make room for at least capacity scores up front, e.g. sized from
+        the video length, so add_score doesn't regrow the buffers mid-session.
+        """
+        if capacity > len(self._timestamps):
+            self._resize(capacity)
+
+    def _grow(self):
+        """Double the capacity of the score buffers."""
+        self._resize(2 * len(self._timestamps))
+
+    def _resize(self, capacity: int):
+        """Reallocate the score buffers, keeping the recorded scores."""
+        for name in ('_timestamps', '_overall', '_arms', '_legs', '_torso'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._count] = old[:self._count]
+            setattr(self, name, new)
 
     def add_score(self, timestamp_ms: float, result: ScoreResult):
         """Record a score at a given timestamp."""
-        self.scores.append(ScoreEntry(
-            timestamp_ms=timestamp_ms,
-            score=result.overall_score,
-            body_parts=result.body_parts,
-        ))
+        if self._count == len(self._timestamps):
+            self._grow()
+
+        i = self._count
+        body_parts = result.body_parts
+        self._timestamps[i] = timestamp_ms
+        self._overall[i] = result.overall_score
+        self._arms[i] = body_parts.arms
+        self._legs[i] = body_parts.legs
+        self._torso[i] = body_parts.torso
+        self._count += 1
+
+        self._sum_score += result.overall_score
+        self._sum_arms += body_parts.arms
+        self._sum_legs += body_parts.legs
+        self._sum_torso += body_parts.torso
 
     def find_teacher_pose(self, timestamp_ms: float) -> Optional[NormalizedPose]:
         """Find teacher pose closest to timestamp."""
-        rounded = round(timestamp_ms)
-
-        if rounded in self.teacher_poses:
-            return self.teacher_poses[rounded]
+        # Round half up with integer truncation - cheaper than round() per frame
+        if timestamp_ms >= 0:
+            rounded = int(timestamp_ms + 0.5)
+        else:
+            rounded = -int(0.5 - timestamp_ms)
 
-        # Find closest timestamp within 100ms
-        closest_time = -1
-        min_diff = float('inf')
+        if rounded == self._last_rounded:
+            return self._last_teacher_pose
 
-        for t in self.teacher_poses.keys():
-            diff = abs(t - rounded)
-            if diff < min_diff:
-                min_diff = diff
-                closest_time = t
+        # Closest timestamp within 100ms: binary search, then compare the
+        # neighbours on either side (earlier one wins a tie, exact hit = 0)
+        ts = self._teacher_ts
+        if len(ts) == 0:
+            return None
 
-        if closest_time >= 0 and min_diff < 100:
-            return self.teacher_poses[closest_time]
+        i = int(np.searchsorted(ts, rounded))
+        best = -1
+        min_diff = float('inf')
+        for j in (i - 1, i):
+            if 0 <= j < len(ts):
+                diff = abs(int(ts[j]) - rounded)
+                if diff < min_diff:
+                    min_diff = diff
+                    best = j
 
-        return None
+        pose = self._teacher_pose_list[best] if best >= 0 and min_diff < 100 else None
+        self._last_rounded = rounded
+        self._last_teacher_pose = pose
+        return pose
 
     def get_session_result(self) -> SessionResult:
         """Generate complete session analysis."""
-        if not self.scores:
+        n = self._count
+        if n == 0:
             return SessionResult(
                 overall_score=0,
                 avg_timing_ms=0,
@@ -125,15 +265,15 @@ class SessionTracker:
             )
 
         # Calculate averages
-        avg_score = sum(s.score for s in self.scores) / len(self.scores)
-        avg_arms = sum(s.body_parts.arms for s in self.scores) / len(self.scores)
-        avg_legs = sum(s.body_parts.legs for s in self.scores) / len(self.scores)
-        avg_torso = sum(s.body_parts.torso for s in self.scores) / len(self.scores)
+        avg_score = self._sum_score / n
+        avg_arms = self._sum_arms / n
+        avg_legs = self._sum_legs / n
+        avg_torso = self._sum_torso / n
 
         # Calculate duration
         duration_ms = 0
-        if len(self.scores) >= 2:
-            duration_ms = self.scores[-1].timestamp_ms - self.scores[0].timestamp_ms
+        if n >= 2:
+            duration_ms = float(self._timestamps[n - 1] - self._timestamps[0])
 
         weak_sections = self._find_weak_sections()
         overall_score = round(avg_score)
@@ -146,7 +286,7 @@ class SessionTracker:
                 legs=round(avg_legs),
                 torso=round(avg_torso),
             ),
-            score_timeline=self.scores.copy(),
+            score_timeline=self.scores,
             weak_sections=weak_sections,
             duration_ms=duration_ms,
             grade=SessionResult.calculate_grade(overall_score),
@@ -157,24 +297,46 @@ class SessionTracker:
         Find sections where dancer struggled.
         Matches web version logic.
         """
-        threshold = 60
-        min_section_duration = 500  # Minimum 500ms to count
-        merge_tolerance = 1000  # Merge sections within 1 second
+        threshold = self.WEAK_THRESHOLD
+        min_section_duration = self.WEAK_MIN_DURATION_MS
+        merge_tolerance = self.WEAK_MERGE_TOLERANCE_MS
+
+        n = self._count
+
+        if NUMBA_AVAILABLE:
+            starts = np.empty(n)
+            ends = np.empty(n)
+            sums = np.empty(n, dtype=np.int64)
+            counts = np.empty(n, dtype=np.int64)
+            found = find_weak_sections(
+                self._timestamps[:n], self._overall[:n],
+                threshold, min_section_duration, merge_tolerance,
+                starts, ends, sums, counts,
+            )
+            sections = [
+                WeakSection(start_ms=start, end_ms=end, score=round(total / count))
+                for start, end, total, count in zip(
+                    starts[:found].tolist(), ends[:found].tolist(),
+                    sums[:found].tolist(), counts[:found].tolist(),
+                )
+            ]
+            return heapq.nsmallest(5, sections, key=attrgetter('score'))
 
         sections: List[WeakSection] = []
         current_section: Optional[Dict] = None
 
-        for entry in self.scores:
-            if entry.score < threshold:
+        for timestamp_ms, score in zip(self._timestamps[:n].tolist(), self._overall[:n].tolist()):
+            if score < threshold:
                 if current_section:
                     # Check if close enough to merge
-                    if entry.timestamp_ms - current_section['end'] < merge_tolerance:
-                        current_section['end'] = entry.timestamp_ms
-                        current_section['scores'].append(entry.score)
+                    if timestamp_ms - current_section['end'] < merge_tolerance:
+                        current_section['end'] = timestamp_ms
+                        current_section['sum'] += score
+                        current_section['count'] += 1
                     else:
                         # Save current section if long enough
                         if current_section['end'] - current_section['start'] >= min_section_duration:
-                            avg = sum(current_section['scores']) / len(current_section['scores'])
+                            avg = current_section['sum'] / current_section['count']
                             sections.append(WeakSection(
                                 start_ms=current_section['start'],
                                 end_ms=current_section['end'],
@@ -182,20 +344,22 @@ class SessionTracker:
                             ))
                         # Start new section
                         current_section = {
-                            'start': entry.timestamp_ms,
-                            'end': entry.timestamp_ms,
-                            'scores': [entry.score],
+                            'start': timestamp_ms,
+                            'end': timestamp_ms,
+                            'sum': score,
+                            'count': 1,
                         }
                 else:
                     current_section = {
-                        'start': entry.timestamp_ms,
-                        'end': entry.timestamp_ms,
-                        'scores': [entry.score],
+                        'start': timestamp_ms,
+                        'end': timestamp_ms,
+                        'sum': score,
+                        'count': 1,
                     }
             elif current_section:
                 # Save current section if long enough
                 if current_section['end'] - current_section['start'] >= min_section_duration:
-                    avg = sum(current_section['scores']) / len(current_section['scores'])
+                    avg = current_section['sum'] / current_section['count']
                     sections.append(WeakSection(
                         start_ms=current_section['start'],
                         end_ms=current_section['end'],
@@ -205,18 +369,23 @@ class SessionTracker:
 
         # Don't forget last section
         if current_section and current_section['end'] - current_section['start'] >= min_section_duration:
-            avg = sum(current_section['scores']) / len(current_section['scores'])
+            avg = current_section['sum'] / current_section['count']
             sections.append(WeakSection(
                 start_ms=current_section['start'],
                 end_ms=current_section['end'],
                 score=round(avg),
             ))
 
-        # Sort by score (worst first) and limit to 5
-        sections.sort(key=lambda s: s.score)
-        return sections[:5]
+        # Worst 5 by score (worst first)
+        return heapq.nsmallest(5, sections, key=attrgetter('score'))
 
     def reset(self):
         """Reset for new session."""
-        self.scores.clear()
+        self._count = 0
+        self._sum_score = 0
+        self._sum_arms = 0
+        self._sum_legs = 0
+        self._sum_torso = 0
+        self._last_rounded = None
+        self._last_teacher_pose = None
         self.start_time_ms = 0
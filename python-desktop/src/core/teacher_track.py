@@ -0,0 +1,194 @@
+"""
+Teacher Pose Track - Precomputed teacher poses for a video.
+
+Teacher poses are deterministic, so instead of running MediaPipe on every
+teacher frame during playback they can be computed once (see
+preprocess_teacher.py) and stored next to the video as `<video>.poses.npz`.
+At runtime a pose is looked up by timestamp.
+"""
+
+import os
+import cv2
+import numpy as np
+from typing import Callable, Optional
+from .pose_detector import PoseDetector, PoseResult
+from .pose_normalizer import PoseNormalizer, NormalizedPose, ANGLE_DEFINITIONS, RELEVANT_INDICES
+
+
+def track_path_for(video_path: str) -> str:
+    """Path of the precomputed pose file for a video."""
+    return video_path + '.poses.npz'
+
+
+class TeacherPoseTrack:
+    """
+    Per-frame teacher poses for a whole video, stored as arrays.
+
+    Frames where no valid pose was detected are kept (valid=False) so that
+    lookups by timestamp stay aligned with the video.
+    """
+
+    def __init__(
+        self,
+        timestamps_ms: np.ndarray,
+        landmarks: np.ndarray,
+        angles: np.ndarray,
+        confidence: np.ndarray,
+        center_scale: np.ndarray,
+        valid: np.ndarray,
+    ):
+        """
+        Args:
+            timestamps_ms: (N,) frame timestamps, ascending
+            landmarks: (N, 33, 4) raw landmarks (x, y, z, visibility)
+            angles: (N, 10) normalized joint angles
+            confidence: (N, 12) keypoint confidence
+            center_scale: (N, 3) center_x, center_y, scale
+            valid: (N,) True where the frame has a valid pose
+        """
+        self.timestamps_ms = timestamps_ms
+        self.landmarks = landmarks
+        self.angles = angles
+        self.confidence = confidence
+        self.center_scale = center_scale
+        self.valid = valid
+
+    def __len__(self) -> int:
+        return len(self.timestamps_ms)
+
+    def _index_at(self, timestamp_ms: float) -> int:
+        """Index of the last frame at or before timestamp_ms."""
+        idx = int(np.searchsorted(self.timestamps_ms, timestamp_ms, side='right')) - 1
+        return max(idx, 0)
+
+    def pose_at(self, timestamp_ms: float) -> Optional[PoseResult]:
+        """Raw pose (for skeleton drawing) at a video timestamp."""
+        if len(self) == 0:
+            return None
+        idx = self._index_at(timestamp_ms)
+        if not self.valid[idx]:
+            return None
+        return PoseResult(
+            landmarks=self.landmarks[idx],
+            timestamp_ms=float(self.timestamps_ms[idx]),
+        )
+
+    def normalized_at(self, timestamp_ms: float) -> Optional[NormalizedPose]:
+        """Normalized pose (for scoring) at a video timestamp."""
+        if len(self) == 0:
+            return None
+        idx = self._index_at(timestamp_ms)
+        if not self.valid[idx]:
+            return None
+        center_x, center_y, scale = self.center_scale[idx].tolist()
+        return NormalizedPose(
+            angles=self.angles[idx],
+            confidence=self.confidence[idx],
+            center_x=center_x,
+            center_y=center_y,
+            scale=scale,
+        )
+
+    def save(self, path: str):
+        """Save the track as a compressed .npz file."""
+        np.savez_compressed(
+            path,
+            timestamps_ms=self.timestamps_ms,
+            landmarks=self.landmarks,
+            angles=self.angles,
+            confidence=self.confidence,
+            center_scale=self.center_scale,
+            valid=self.valid,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'TeacherPoseTrack':
+        """Load a track saved with save()."""
+        with np.load(path) as data:
+            return cls(
+                timestamps_ms=data['timestamps_ms'],
+                landmarks=data['landmarks'],
+                angles=data['angles'],
+                confidence=data['confidence'],
+                center_scale=data['center_scale'],
+                valid=data['valid'],
+            )
+
+    @classmethod
+    def load_for_video(cls, video_path: str) -> Optional['TeacherPoseTrack']:
+        """Load the precomputed track for a video, or None if there isn't one."""
+        path = track_path_for(video_path)
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls.load(path)
+        except (OSError, KeyError, ValueError):
+            return None  # Unreadable/outdated file - fall back to live detection
+
+    @classmethod
+    def build(
+        cls,
+        video_path: str,
+        model_complexity: int = 1,
+        smoothing_factor: float = 0.2,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> 'TeacherPoseTrack':
+        """
+        Run pose detection over every frame of a video.
+
+        Args:
+            video_path: Teacher video file
+            model_complexity: MediaPipe model (0=Lite, 1=Full, 2=Heavy)
+            smoothing_factor: Angle smoothing, same meaning as PoseNormalizer
+            progress: Optional callback(frame_index, frame_count)
+        """
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise RuntimeError(f"Failed to open video: {video_path}")
+
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        num_angles = len(ANGLE_DEFINITIONS)
+        num_conf = len(RELEVANT_INDICES)
+
+        timestamps, landmarks, angles, confidence, center_scale, valid = [], [], [], [], [], []
+        normalizer = PoseNormalizer(smoothing_factor=smoothing_factor)
+
+        with PoseDetector(model_complexity=model_complexity) as detector:
+            index = 0
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+
+                timestamp_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+                pose = detector.detect(frame, timestamp_ms)
+                normalized = normalizer.normalize(pose) if pose else None
+
+                timestamps.append(timestamp_ms)
+                if normalized is not None:
+                    landmarks.append(pose.landmarks)
+                    angles.append(normalized.angles)
+                    confidence.append(normalized.confidence)
+                    center_scale.append((normalized.center_x, normalized.center_y, normalized.scale))
+                    valid.append(True)
+                else:
+                    landmarks.append(np.zeros((33, 4), dtype=np.float32))
+                    angles.append(np.zeros(num_angles, dtype=np.float32))
+                    confidence.append(np.zeros(num_conf, dtype=np.float32))
+                    center_scale.append((0.0, 0.0, 1.0))
+                    valid.append(False)
+
+                index += 1
+                if progress:
+                    progress(index, frame_count)
+
+        cap.release()
+
+        return cls(
+            timestamps_ms=np.asarray(timestamps, dtype=np.float64),
+            landmarks=np.asarray(landmarks, dtype=np.float32).reshape(-1, 33, 4),
+            angles=np.asarray(angles, dtype=np.float32).reshape(-1, num_angles),
+            confidence=np.asarray(confidence, dtype=np.float32).reshape(-1, num_conf),
+            center_scale=np.asarray(center_scale, dtype=np.float32).reshape(-1, 3),
+            valid=np.asarray(valid, dtype=bool),
+        )
@@ -0,0 +1,21 @@
+"""
+Process-wide runtime settings that must be in place before NumPy, OpenCV
+or MediaPipe are imported. Entry points call configure_inference_env()
+first thing, so this module imports nothing heavy itself.
+"""
+
+import os
+
+
+def configure_inference_env():
+    """
+    Set CPU threading options for MediaPipe's TFLite runtime and the
+    OpenMP/BLAS libraries. They are only read when those libraries load,
+    so this must run at process start, before other threads exist. Values
+    already set in the environment are left alone.
+    """
+    # Physical cores - hyperthread oversubscription slows TFLite down
+    threads = str(max(1, (os.cpu_count() or 2) // 2))
+    os.environ.setdefault('TF_ENABLE_ONEDNN_OPTS', '1')
+    os.environ.setdefault('XNNPACK_NUM_THREADS', threads)
+    os.environ.setdefault('OMP_NUM_THREADS', threads)
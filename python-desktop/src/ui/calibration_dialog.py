@@ -3,13 +3,21 @@ Calibration Dialog - Pre-session position checks.
 Simple and clean design.
 """
 
+import time
+import numpy as np
 from typing import Optional
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QWidget
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QVariantAnimation, QAbstractAnimation, pyqtSignal, pyqtSlot
 
 from ..core.pose_detector import PoseResult
+from ..core._kernels import NUMBA_AVAILABLE, calibration_checks
+
+
+# Shoulders, hips, elbows, knees
+KEY_INDICES = (11, 12, 23, 24, 13, 14, 25, 26)
+KEY_IDX = np.array(KEY_INDICES, dtype=np.intp)
 
 
 class CheckItem(QFrame):
@@ -19,6 +27,7 @@ class CheckItem(QFrame):
         super().__init__(parent)
         self._label_text = label
         self._passed = False
+        self._status_text = "Checking..."
         self.setObjectName("checkItem")
         self._setup_ui()
 
@@ -29,63 +38,231 @@ class CheckItem(QFrame):
 
         # Icon
         self._icon = QLabel("○")
+        self._icon.setObjectName("checkIcon")
         self._icon.setFixedWidth(20)
-        self._icon.setStyleSheet("font-size: 16px; color: #666666; border: none;")
         layout.addWidget(self._icon)
 
         # Label
         self._label = QLabel(self._label_text)
-        self._label.setStyleSheet("font-size: 14px; color: #cccccc; border: none;")
+        self._label.setObjectName("checkLabel")
         layout.addWidget(self._label, 1)
 
         # Status
-        self._status = QLabel("Checking...")
-        self._status.setStyleSheet("font-size: 12px; color: #666666; border: none;")
+        self._status = QLabel(self._status_text)
+        self._status.setObjectName("checkStatus")
         layout.addWidget(self._status)
 
-        self.setStyleSheet("#checkItem { background: #2a2a2a; border: none; border-radius: 6px; }")
+        # Colours come from the app stylesheet, keyed on the "state" property
+        for widget in (self._icon, self._label, self._status):
+            widget.setProperty("state", "fail")
 
     def set_passed(self, passed: bool, status: str = ""):
+        status = status or ("OK" if passed else "Not ready")
+
+        # Called every pose frame - only touch the widgets on a change
+        if passed == self._passed and status == self._status_text:
+            return
+
+        if status != self._status_text:
+            self._status_text = status
+            self._status.setText(status)
+
+        if passed == self._passed:
+            return
         self._passed = passed
-        self._status.setText(status or ("OK" if passed else "Not ready"))
 
-        if passed:
-            self._icon.setText("✓")
-            self._icon.setStyleSheet("font-size: 16px; color: #22c55e; border: none;")
-            self._label.setStyleSheet("font-size: 14px; color: #22c55e; border: none;")
-            self._status.setStyleSheet("font-size: 12px; color: #22c55e; border: none;")
-        else:
-            self._icon.setText("○")
-            self._icon.setStyleSheet("font-size: 16px; color: #666666; border: none;")
-            self._label.setStyleSheet("font-size: 14px; color: #cccccc; border: none;")
-            self._status.setStyleSheet("font-size: 12px; color: #666666; border: none;")
+        self._icon.setText("✓" if passed else "○")
+
+        # Re-polish so the app stylesheet picks up the new state; this
+        # re-resolves the rules without parsing a stylesheet again
+        state = "pass" if passed else "fail"
+        for widget in (self._icon, self._label, self._status):
+            widget.setProperty("state", state)
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
 
     @property
     def passed(self):
         return self._passed
 
 
-class CalibrationDialog(QDialog):
+class _CalibrationChecks:
+    """
+    Position checks and countdown shared by CalibrationDialog and
+    CalibrationOverlay. The widget provides the check items, countdown and
+    status labels, start button and the _STATUS_*_QSS sheets in _setup_ui,
+    and calls _init_checks() before it.
+    """
+
+    MIN_VISIBLE_KEYPOINTS = 20
+    MIN_BODY_RATIO = 0.3
+    MAX_BODY_RATIO = 0.9
+    VISIBILITY_THRESHOLD = 0.5
+    KEY_VISIBILITY_THRESHOLD = 0.6
+    MIN_KEY_JOINTS = 6
+
+    COUNTDOWN_SECONDS = 3
+
+    def _init_checks(self):
+        self._all_ok = False
+        self._last_pose: Optional[PoseResult] = None
+        self._last_frame_size = None
+        self._countdown_pose = None
+        self._check_out = np.empty(3)
+
+        # Countdown driven by Qt: an int animation from N+1 down to 1 over
+        # N seconds truncates to N, ..., 1 for one second each, and only
+        # emits valueChanged when the shown number changes
+        self._countdown_anim = QVariantAnimation(self)
+        self._countdown_anim.setStartValue(self.COUNTDOWN_SECONDS + 1)
+        self._countdown_anim.setEndValue(1)
+        self._countdown_anim.setDuration(self.COUNTDOWN_SECONDS * 1000)
+        self._countdown_anim.valueChanged.connect(self._show_countdown)
+        self._countdown_anim.finished.connect(self._start)
+
+    def _submit_pose(self, pose: Optional[PoseResult], frame_width: int, frame_height: int):
+        """Run the checks, or hold the pose for the next tick while counting down."""
+        if self._countdown_anim.state() == QAbstractAnimation.State.Running:
+            self._countdown_pose = (pose, frame_width, frame_height)
+            return
+        self._check_pose(pose, frame_width, frame_height)
+
+    def _check_pose(self, pose: Optional[PoseResult], frame_width: int, frame_height: int):
+        """Update checks based on pose."""
+        # Same pose object re-sent (e.g. the camera is faster than detection)
+        frame_size = (frame_width, frame_height)
+        if pose is self._last_pose and frame_size == self._last_frame_size:
+            return
+        self._last_pose = pose
+        self._last_frame_size = frame_size
+
+        if pose is None or len(pose.landmarks) == 0:
+            self._body_check.set_passed(False, "No body")
+            self._distance_check.set_passed(False, "-")
+            self._joints_check.set_passed(False, "-")
+            self._update_state()
+            return
+
+        if NUMBA_AVAILABLE:
+            # Counts and bounding box in one compiled pass
+            out = self._check_out
+            calibration_checks(
+                np.ascontiguousarray(pose.landmarks, dtype=np.float32), KEY_IDX,
+                self.VISIBILITY_THRESHOLD, self.KEY_VISIBILITY_THRESHOLD, out,
+            )
+            visible = int(out[0])
+            ratio = float(out[1])
+            key_vis = int(out[2])
+        else:
+            # Same single pass as the kernel: for 33 landmarks a plain loop
+            # beats building a masked copy and reducing it four times
+            visible = 0
+            min_x = min_y = float('inf')
+            max_x = max_y = float('-inf')
+            for x, y, _, vis in pose.landmarks.tolist():
+                if vis > self.VISIBILITY_THRESHOLD:
+                    visible += 1
+                    if x < min_x:
+                        min_x = x
+                    if x > max_x:
+                        max_x = x
+                    if y < min_y:
+                        min_y = y
+                    if y > max_y:
+                        max_y = y
+            ratio = max(max_x - min_x, max_y - min_y) if visible else 0.0
+            key_vis = int(np.count_nonzero(pose.visibility[KEY_IDX] > self.KEY_VISIBILITY_THRESHOLD))
+
+        # Check 1: Body visible
+        body_ok = visible >= self.MIN_VISIBLE_KEYPOINTS
+        self._body_check.set_passed(body_ok, f"{visible} joints" if body_ok else f"Only {visible}")
+
+        # Check 2: Distance
+        if body_ok:
+            if ratio < self.MIN_BODY_RATIO:
+                self._distance_check.set_passed(False, "Too far")
+            elif ratio > self.MAX_BODY_RATIO:
+                self._distance_check.set_passed(False, "Too close")
+            else:
+                self._distance_check.set_passed(True, "Good")
+        else:
+            self._distance_check.set_passed(False, "-")
+
+        # Check 3: Key joints
+        joints_ok = key_vis >= self.MIN_KEY_JOINTS
+        self._joints_check.set_passed(joints_ok, f"{key_vis}/{len(KEY_IDX)}" if not joints_ok else "All visible")
+
+        self._update_state()
+
+    def _update_state(self):
+        all_ok = self._body_check.passed and self._distance_check.passed and self._joints_check.passed
+        if all_ok == self._all_ok:
+            return  # Same state as last frame - widgets are already up to date
+        self._all_ok = all_ok
+        self._start_btn.setEnabled(all_ok)
+
+        if all_ok:
+            if self._countdown_anim.state() != QAbstractAnimation.State.Running:
+                self._countdown_label.setText(str(self.COUNTDOWN_SECONDS))
+                self._countdown_anim.start()
+                self._countdown_label.show()
+                self._status.setText("Get ready!")
+                self._status.setStyleSheet(self._STATUS_READY_QSS)
+        else:
+            self._countdown_anim.stop()
+            self._countdown_label.hide()
+            self._status.setText("Waiting for position...")
+            self._status.setStyleSheet(self._STATUS_WAITING_QSS)
+
+    def reset(self):
+        """Return to the initial waiting state, ready to be shown again."""
+        self._countdown_anim.stop()
+        self._body_check.set_passed(False, "Checking...")
+        self._distance_check.set_passed(False, "Checking...")
+        self._joints_check.set_passed(False, "Checking...")
+        self._start_btn.setEnabled(False)
+        self._countdown_label.hide()
+        self._status.setText("Waiting for position...")
+        self._status.setStyleSheet(self._STATUS_WAITING_QSS)
+        self._all_ok = False
+        self._last_pose = None
+        self._last_frame_size = None
+        self._countdown_pose = None
+
+    def _show_countdown(self, value):
+        self._countdown_label.setText(str(value))
+
+        # Poses are only re-checked once per tick during the countdown;
+        # stepping out of position still cancels it within a second
+        if self._countdown_pose is not None:
+            pose, frame_width, frame_height = self._countdown_pose
+            self._countdown_pose = None
+            self._check_pose(pose, frame_width, frame_height)
+
+
+class CalibrationDialog(_CalibrationChecks, QDialog):
     """Calibration dialog for pre-session checks."""
 
     calibration_complete = pyqtSignal()
     cancelled = pyqtSignal()
 
-    MIN_VISIBLE_KEYPOINTS = 20
-    MIN_BODY_RATIO = 0.3
-    MAX_BODY_RATIO = 0.9
+    # Once all checks pass, re-check at most this often (seconds)
+    UPDATE_INTERVAL = 0.1
+
+    # Status label stylesheets while counting down / waiting
+    _STATUS_READY_QSS = "font-size: 14px; color: #22c55e;"
+    _STATUS_WAITING_QSS = "font-size: 14px; color: #3b82f6;"
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._countdown = 3
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._tick)
+        self._last_update = 0.0
+        self._init_checks()
         self._setup_ui()
 
     def _setup_ui(self):
         self.setWindowTitle("Position Check")
         self.setFixedSize(380, 340)
-        self.setStyleSheet("QDialog { background: #1a1a1a; }")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -93,13 +270,13 @@ class CalibrationDialog(QDialog):
 
         # Title
         title = QLabel("Position Check")
-        title.setStyleSheet("font-size: 22px; font-weight: bold; color: white;")
+        title.setObjectName("calibrationTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         # Subtitle
         sub = QLabel("Stand in front of the camera")
-        sub.setStyleSheet("font-size: 13px; color: #888888;")
+        sub.setObjectName("calibrationSubtitle")
         sub.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(sub)
 
@@ -118,14 +295,14 @@ class CalibrationDialog(QDialog):
 
         # Countdown
         self._countdown_label = QLabel("")
-        self._countdown_label.setStyleSheet("font-size: 56px; font-weight: bold; color: #22c55e;")
+        self._countdown_label.setObjectName("calibrationCountdown")
         self._countdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._countdown_label.hide()
         layout.addWidget(self._countdown_label)
 
         # Status
         self._status = QLabel("Waiting for position...")
-        self._status.setStyleSheet("font-size: 14px; color: #3b82f6;")
+        self._status.setStyleSheet(self._STATUS_WAITING_QSS)
         self._status.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self._status)
 
@@ -136,18 +313,8 @@ class CalibrationDialog(QDialog):
 
         self._back_btn = QPushButton("Back")
         self._back_btn.setFixedHeight(40)
-        self._back_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                color: #cccccc;
-                border: none;
-                border-radius: 6px;
-                padding: 0 20px;
-                font-size: 13px;
-            }
-            QPushButton:hover { background: #444444; }
-        """)
-        self._back_btn.clicked.connect(self._cancel)
+        self._back_btn.setObjectName("calibrationBackButton")
+        self._back_btn.clicked.connect(self._cancel, Qt.ConnectionType.DirectConnection)
         btn_layout.addWidget(self._back_btn)
 
         btn_layout.addStretch()
@@ -155,141 +322,71 @@ class CalibrationDialog(QDialog):
         self._start_btn = QPushButton("Start Now")
         self._start_btn.setFixedHeight(40)
         self._start_btn.setEnabled(False)
-        self._start_btn.setStyleSheet("""
-            QPushButton {
-                background: #2563eb;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 0 24px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background: #3b82f6; }
-            QPushButton:disabled { background: #333333; color: #666666; }
-        """)
-        self._start_btn.clicked.connect(self._start)
+        self._start_btn.setObjectName("calibrationStartButton")
+        self._start_btn.clicked.connect(self._start, Qt.ConnectionType.DirectConnection)
         btn_layout.addWidget(self._start_btn)
 
         layout.addLayout(btn_layout)
 
     def update_pose(self, pose: Optional[PoseResult], frame_width: int, frame_height: int):
         """Update checks based on pose."""
-        if not pose or not pose.keypoints:
-            self._body_check.set_passed(False, "No body")
-            self._distance_check.set_passed(False, "-")
-            self._joints_check.set_passed(False, "-")
-            self._update_state()
+        # Steady state needs only a few updates per second; while a check
+        # is failing every frame is used so fixes show up immediately
+        now = time.perf_counter()
+        if self._all_ok and now - self._last_update < self.UPDATE_INTERVAL:
             return
+        self._last_update = now
 
-        kps = pose.keypoints
-
-        # Check 1: Body visible
-        visible = sum(1 for k in kps if k.visibility > 0.5)
-        body_ok = visible >= self.MIN_VISIBLE_KEYPOINTS
-        self._body_check.set_passed(body_ok, f"{visible} joints" if body_ok else f"Only {visible}")
-
-        # Check 2: Distance
-        if body_ok:
-            vis_kps = [k for k in kps if k.visibility > 0.5]
-            w = max(k.x for k in vis_kps) - min(k.x for k in vis_kps)
-            h = max(k.y for k in vis_kps) - min(k.y for k in vis_kps)
-            ratio = max(w, h)
-
-            if ratio < self.MIN_BODY_RATIO:
-                self._distance_check.set_passed(False, "Too far")
-            elif ratio > self.MAX_BODY_RATIO:
-                self._distance_check.set_passed(False, "Too close")
-            else:
-                self._distance_check.set_passed(True, "Good")
-        else:
-            self._distance_check.set_passed(False, "-")
-
-        # Check 3: Key joints
-        key_idx = [11, 12, 23, 24, 13, 14, 25, 26]
-        key_vis = sum(1 for i in key_idx if kps[i].visibility > 0.6)
-        joints_ok = key_vis >= 6
-        self._joints_check.set_passed(joints_ok, f"{key_vis}/8" if not joints_ok else "All visible")
-
-        self._update_state()
-
-    def _update_state(self):
-        all_ok = self._body_check.passed and self._distance_check.passed and self._joints_check.passed
-        self._start_btn.setEnabled(all_ok)
-
-        if all_ok:
-            if not self._timer.isActive():
-                self._countdown = 3
-                self._timer.start(1000)
-                self._countdown_label.setText(str(self._countdown))
-                self._countdown_label.show()
-                self._status.setText("Get ready!")
-                self._status.setStyleSheet("font-size: 14px; color: #22c55e;")
-        else:
-            self._timer.stop()
-            self._countdown_label.hide()
-            self._status.setText("Waiting for position...")
-            self._status.setStyleSheet("font-size: 14px; color: #3b82f6;")
-
-    def _tick(self):
-        self._countdown -= 1
-        if self._countdown <= 0:
-            self._timer.stop()
-            self._start()
-        else:
-            self._countdown_label.setText(str(self._countdown))
+        self._submit_pose(pose, frame_width, frame_height)
 
+    @pyqtSlot()
     def _start(self):
-        self._timer.stop()
+        self._countdown_anim.stop()
         self.calibration_complete.emit()
         self.accept()
 
+    @pyqtSlot()
     def _cancel(self):
-        self._timer.stop()
+        self._countdown_anim.stop()
         self.cancelled.emit()
         self.reject()
 
     def reset(self):
-        self._body_check.set_passed(False, "Checking...")
-        self._distance_check.set_passed(False, "Checking...")
-        self._joints_check.set_passed(False, "Checking...")
-        self._start_btn.setEnabled(False)
-        self._countdown_label.hide()
-        self._status.setText("Waiting for position...")
-        self._timer.stop()
+        super().reset()
+        self._last_update = 0.0
 
 
-class CalibrationOverlay(QWidget):
+class CalibrationOverlay(_CalibrationChecks, QWidget):
     """Non-modal calibration overlay widget."""
 
     calibration_complete = pyqtSignal()
     cancelled = pyqtSignal()
 
-    MIN_VISIBLE_KEYPOINTS = 20
-    MIN_BODY_RATIO = 0.3
-    MAX_BODY_RATIO = 0.9
+    # Status label stylesheets while counting down / waiting
+    _STATUS_READY_QSS = "font-size: 13px; color: #22c55e; background: transparent;"
+    _STATUS_WAITING_QSS = "font-size: 13px; color: #3b82f6; background: transparent;"
+
+    # Checks are re-run at most this often (ms); poses arriving in between
+    # are coalesced and only the latest one is checked
+    REFRESH_INTERVAL_MS = 100
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._countdown = 3
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._tick)
+        self._pending_pose = None
+        self._init_checks()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._refresh_timer.timeout.connect(self._apply_pending_pose)
         self._setup_ui()
 
     def _setup_ui(self):
         self.setFixedSize(380, 320)
 
-        # Container frame with styled background - use object name for specific styling
+        # Container frame with styled background (see #calibrationContainer in dark.qss)
         container = QFrame(self)
         container.setObjectName("calibrationContainer")
         container.setGeometry(0, 0, 380, 320)
-        container.setStyleSheet("""
-            #calibrationContainer {
-                background: #1a1a1a;
-                border: 2px solid #3b82f6;
-                border-radius: 12px;
-            }
-        """)
 
         layout = QVBoxLayout(container)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -297,12 +394,12 @@ class CalibrationOverlay(QWidget):
 
         # Title
         title = QLabel("Position Check")
-        title.setStyleSheet("font-size: 20px; font-weight: bold; color: white;")
+        title.setObjectName("calibrationTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         subtitle = QLabel("Stand back so your full body is visible")
-        subtitle.setStyleSheet("font-size: 12px; color: #888;")
+        subtitle.setObjectName("calibrationSubtitle")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
 
@@ -319,14 +416,14 @@ class CalibrationOverlay(QWidget):
 
         # Countdown
         self._countdown_label = QLabel("")
-        self._countdown_label.setStyleSheet("font-size: 42px; font-weight: bold; color: #22c55e;")
+        self._countdown_label.setObjectName("calibrationCountdown")
         self._countdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._countdown_label.hide()
         layout.addWidget(self._countdown_label)
 
         # Status
         self._status = QLabel("Waiting for position...")
-        self._status.setStyleSheet("font-size: 14px; color: #3b82f6;")
+        self._status.setStyleSheet(self._STATUS_WAITING_QSS)
         self._status.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self._status)
 
@@ -338,18 +435,8 @@ class CalibrationOverlay(QWidget):
 
         self._back_btn = QPushButton("Cancel")
         self._back_btn.setFixedHeight(40)
-        self._back_btn.setStyleSheet("""
-            QPushButton {
-                background: #374151;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 20px;
-                font-size: 14px;
-            }
-            QPushButton:hover { background: #4b5563; }
-        """)
-        self._back_btn.clicked.connect(self._cancel)
+        self._back_btn.setObjectName("calibrationBackButton")
+        self._back_btn.clicked.connect(self._cancel, Qt.ConnectionType.DirectConnection)
         btn_layout.addWidget(self._back_btn)
 
         btn_layout.addStretch()
@@ -357,94 +444,38 @@ class CalibrationOverlay(QWidget):
         self._start_btn = QPushButton("Start Now")
         self._start_btn.setFixedHeight(40)
         self._start_btn.setEnabled(False)
-        self._start_btn.setStyleSheet("""
-            QPushButton {
-                background: #2563eb;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background: #3b82f6; }
-            QPushButton:disabled { background: #374151; color: #666666; }
-        """)
-        self._start_btn.clicked.connect(self._start)
+        self._start_btn.setObjectName("calibrationStartButton")
+        self._start_btn.clicked.connect(self._start, Qt.ConnectionType.DirectConnection)
         btn_layout.addWidget(self._start_btn)
 
         layout.addLayout(btn_layout)
 
     def update_pose(self, pose: Optional[PoseResult], frame_width: int, frame_height: int):
-        """Update checks based on pose."""
-        if not pose or not pose.keypoints:
-            self._body_check.set_passed(False, "No body")
-            self._distance_check.set_passed(False, "-")
-            self._joints_check.set_passed(False, "-")
-            self._update_state()
-            return
-
-        kps = pose.keypoints
-
-        # Check 1: Body visible
-        visible = sum(1 for k in kps if k.visibility > 0.5)
-        body_ok = visible >= self.MIN_VISIBLE_KEYPOINTS
-        self._body_check.set_passed(body_ok, f"{visible} joints" if body_ok else f"Only {visible}")
-
-        # Check 2: Distance
-        if body_ok:
-            vis_kps = [k for k in kps if k.visibility > 0.5]
-            w = max(k.x for k in vis_kps) - min(k.x for k in vis_kps)
-            h = max(k.y for k in vis_kps) - min(k.y for k in vis_kps)
-            ratio = max(w, h)
-
-            if ratio < self.MIN_BODY_RATIO:
-                self._distance_check.set_passed(False, "Too far")
-            elif ratio > self.MAX_BODY_RATIO:
-                self._distance_check.set_passed(False, "Too close")
-            else:
-                self._distance_check.set_passed(True, "Good")
-        else:
-            self._distance_check.set_passed(False, "-")
-
-        # Check 3: Key joints
-        key_idx = [11, 12, 23, 24, 13, 14, 25, 26]
-        key_vis = sum(1 for i in key_idx if kps[i].visibility > 0.6)
-        joints_ok = key_vis >= 6
-        self._joints_check.set_passed(joints_ok, f"{key_vis}/8" if not joints_ok else "All visible")
-
-        self._update_state()
-
-    def _update_state(self):
-        all_ok = self._body_check.passed and self._distance_check.passed and self._joints_check.passed
-        self._start_btn.setEnabled(all_ok)
-
-        if all_ok:
-            if not self._timer.isActive():
-                self._countdown = 3
-                self._timer.start(1000)
-                self._countdown_label.setText(str(self._countdown))
-                self._countdown_label.show()
-                self._status.setText("Get ready!")
-                self._status.setStyleSheet("font-size: 13px; color: #22c55e; background: transparent;")
-        else:
-            self._timer.stop()
-            self._countdown_label.hide()
-            self._status.setText("Waiting for position...")
-            self._status.setStyleSheet("font-size: 13px; color: #3b82f6; background: transparent;")
-
-    def _tick(self):
-        self._countdown -= 1
-        if self._countdown <= 0:
-            self._timer.stop()
-            self._start()
-        else:
-            self._countdown_label.setText(str(self._countdown))
-
+        """Queue a pose for the next check refresh (the latest pose wins)."""
+        self._pending_pose = (pose, frame_width, frame_height)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(self.REFRESH_INTERVAL_MS)
+
+    @pyqtSlot()
+    def _apply_pending_pose(self):
+        if self._pending_pose is not None:
+            pose, frame_width, frame_height = self._pending_pose
+            self._pending_pose = None
+            self._submit_pose(pose, frame_width, frame_height)
+
+    @pyqtSlot()
     def _start(self):
-        self._timer.stop()
+        self._countdown_anim.stop()
+        self._refresh_timer.stop()
         self.calibration_complete.emit()
 
+    @pyqtSlot()
     def _cancel(self):
-        self._timer.stop()
+        self._countdown_anim.stop()
+        self._refresh_timer.stop()
         self.cancelled.emit()
+
+    def reset(self):
+        self._refresh_timer.stop()
+        self._pending_pose = None
+        super().reset()
@@ -9,8 +9,8 @@ from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QPushButton, QSlider,
     QLabel, QComboBox, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+from .fonts import ui_font
 
 
 class ControlsWidget(QWidget):
@@ -31,10 +31,22 @@ class ControlsWidget(QWidget):
     speed_changed = pyqtSignal(float)
     seek_requested = pyqtSignal(float)
 
+    # Seeks while dragging are emitted at most this often (ms), latest wins
+    SEEK_INTERVAL_MS = 50
+
+    # Speed combo entries and the playback rate for each, in display order
+    SPEEDS = {"0.5x": 0.5, "0.75x": 0.75, "1x": 1.0, "1.25x": 1.25, "1.5x": 1.5}
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._is_playing = False
         self._duration_ms = 0
+        self._time_label_secs = (0, 0)  # (current, duration) shown in _time_label
+        self._pending_seek_ms: Optional[float] = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(self.SEEK_INTERVAL_MS)
+        self._seek_timer.timeout.connect(self._emit_seek)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -42,173 +54,84 @@ class ControlsWidget(QWidget):
         layout.setContentsMargins(16, 12, 16, 12)
         layout.setSpacing(12)
 
-        # Matches web version: bg-gray-800/90
-        self.setStyleSheet("""
-            ControlsWidget {
-                background: rgba(31, 41, 55, 0.95);
-                border-top: 1px solid #374151;
-            }
-        """)
+        # Matches web version: bg-gray-800/90 (styles live in dark.qss)
 
         # Play/Pause button
         self._play_btn = QPushButton("▶ Play")
-        self._play_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        self._play_btn.setFont(ui_font(12, bold=True))
         self._play_btn.setFixedSize(100, 40)
-        self._play_btn.setStyleSheet("""
-            QPushButton {
-                background: #3b82f6;
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background: #2563eb;
-            }
-            QPushButton:pressed {
-                background: #1d4ed8;
-            }
-        """)
-        self._play_btn.clicked.connect(self._on_play_clicked)
+        self._play_btn.setObjectName("playButton")
+        self._play_btn.clicked.connect(self._on_play_clicked, Qt.ConnectionType.DirectConnection)
         layout.addWidget(self._play_btn)
 
         # Restart button
         self._restart_btn = QPushButton("↺")
-        self._restart_btn.setFont(QFont("Arial", 16))
+        self._restart_btn.setFont(ui_font(16))
         self._restart_btn.setFixedSize(40, 40)
         self._restart_btn.setToolTip("Restart")
-        self._restart_btn.setStyleSheet("""
-            QPushButton {
-                background: #374151;
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background: #4b5563;
-            }
-        """)
-        self._restart_btn.clicked.connect(self.restart_clicked.emit)
+        self._restart_btn.setObjectName("restartButton")
+        self._restart_btn.clicked.connect(self.restart_clicked.emit, Qt.ConnectionType.DirectConnection)
         layout.addWidget(self._restart_btn)
 
         # Progress slider
         self._progress_slider = QSlider(Qt.Orientation.Horizontal)
         self._progress_slider.setRange(0, 1000)
         self._progress_slider.setValue(0)
-        self._progress_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #374151;
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #3b82f6;
-                width: 16px;
-                height: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #3b82f6;
-                border-radius: 3px;
-            }
-        """)
-        self._progress_slider.sliderMoved.connect(self._on_seek)
+        self._progress_slider.sliderMoved.connect(self._on_seek, Qt.ConnectionType.DirectConnection)
         layout.addWidget(self._progress_slider, 1)
 
         # Time label
         self._time_label = QLabel("0:00 / 0:00")
-        self._time_label.setFont(QFont("Arial", 11))
-        self._time_label.setStyleSheet("color: #888;")
+        self._time_label.setFont(ui_font(11))
         self._time_label.setFixedWidth(100)
         layout.addWidget(self._time_label)
 
         # Speed control
         speed_label = QLabel("Speed:")
-        speed_label.setStyleSheet("color: #888;")
         layout.addWidget(speed_label)
 
         self._speed_combo = QComboBox()
-        self._speed_combo.addItems(["0.5x", "0.75x", "1x", "1.25x", "1.5x"])
+        self._speed_combo.addItems(self.SPEEDS)
         self._speed_combo.setCurrentText("1x")
         self._speed_combo.setFixedWidth(80)
         self._speed_combo.setFixedHeight(36)
-        self._speed_combo.setStyleSheet("""
-            QComboBox {
-                background: #374151;
-                color: white;
-                border: 1px solid #4b5563;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 13px;
-            }
-            QComboBox:hover {
-                border: 1px solid #3b82f6;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 24px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #9ca3af;
-                margin-right: 8px;
-            }
-            QComboBox QAbstractItemView {
-                background: #1f2937;
-                color: white;
-                selection-background-color: #3b82f6;
-                border: 1px solid #4b5563;
-                padding: 4px;
-                outline: none;
-            }
-            QComboBox QAbstractItemView::item {
-                min-height: 32px;
-                padding: 6px 12px;
-            }
-            QComboBox QAbstractItemView::item:hover {
-                background: #374151;
-            }
-            QComboBox QAbstractItemView::item:selected {
-                background: #3b82f6;
-            }
-        """)
-        self._speed_combo.currentTextChanged.connect(self._on_speed_changed)
+        self._speed_combo.setObjectName("speedCombo")
+        self._speed_combo.currentTextChanged.connect(self._on_speed_changed, Qt.ConnectionType.DirectConnection)
         layout.addWidget(self._speed_combo)
 
         # End session button
         self._stop_btn = QPushButton("End Session")
-        self._stop_btn.setFont(QFont("Arial", 11))
+        self._stop_btn.setFont(ui_font(11))
         self._stop_btn.setFixedSize(110, 40)
-        self._stop_btn.setStyleSheet("""
-            QPushButton {
-                background: #dc2626;
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background: #b91c1c;
-            }
-        """)
-        self._stop_btn.clicked.connect(self.stop_clicked.emit)
+        self._stop_btn.setObjectName("endSessionButton")
+        self._stop_btn.clicked.connect(self.stop_clicked.emit, Qt.ConnectionType.DirectConnection)
         layout.addWidget(self._stop_btn)
 
+    @pyqtSlot()
     def _on_play_clicked(self):
         """Handle play button click."""
         self.play_clicked.emit()
 
+    @pyqtSlot(int)
     def _on_seek(self, value: int):
         """Handle seek slider movement."""
         if self._duration_ms > 0:
-            position_ms = (value / 1000) * self._duration_ms
+            self._pending_seek_ms = (value / 1000) * self._duration_ms
+            if not self._seek_timer.isActive():
+                self._seek_timer.start()
+
+    @pyqtSlot()
+    def _emit_seek(self):
+        """Emit the latest seek position from a slider drag."""
+        if self._pending_seek_ms is not None:
+            position_ms = self._pending_seek_ms
+            self._pending_seek_ms = None
             self.seek_requested.emit(position_ms)
 
+    @pyqtSlot(str)
     def _on_speed_changed(self, text: str):
         """Handle speed combo change."""
-        speed = float(text.replace("x", ""))
-        self.speed_changed.emit(speed)
+        self.speed_changed.emit(self.SPEEDS[text])
 
     def set_playing(self, is_playing: bool):
         """Update play/pause button state."""
@@ -241,6 +164,11 @@ class ControlsWidget(QWidget):
         current_sec = int(current_ms / 1000)
         duration_sec = int(self._duration_ms / 1000)
 
+        # Called every frame but the text only changes once a second
+        if (current_sec, duration_sec) == self._time_label_secs:
+            return
+        self._time_label_secs = (current_sec, duration_sec)
+
         current_str = f"{current_sec // 60}:{current_sec % 60:02d}"
         duration_str = f"{duration_sec // 60}:{duration_sec % 60:02d}"
 
@@ -250,9 +178,11 @@ class ControlsWidget(QWidget):
         """Reset to initial state."""
         self._is_playing = False
         self._duration_ms = 0
+        self._seek_timer.stop()
+        self._pending_seek_ms = None
         self._play_btn.setText("▶ Play")
         self._progress_slider.setValue(0)
-        self._time_label.setText("0:00 / 0:00")
+        self._update_time_label(0)
         self._speed_combo.setCurrentText("1x")
         self.set_controls_enabled(False)  # Disabled until calibration complete
 
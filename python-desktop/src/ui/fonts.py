@@ -0,0 +1,17 @@
+"""
+Fonts - Shared QFont instances for the UI.
+
+Fonts are created on first use (a QFont needs the QApplication to exist)
+and then reused by every widget that asks for the same size and weight.
+"""
+
+from functools import lru_cache
+from PyQt6.QtGui import QFont
+
+
+@lru_cache(maxsize=None)
+def ui_font(size: int, bold: bool = False) -> QFont:
+    """The app's Arial font at a point size, optionally bold."""
+    if bold:
+        return QFont("Arial", size, QFont.Weight.Bold)
+    return QFont("Arial", size)
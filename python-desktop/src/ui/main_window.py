@@ -6,15 +6,16 @@ OPTIMIZED: Pose detection runs in separate thread for smooth UI.
 """
 
 import os
-import time
 from typing import Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QFileDialog, QMessageBox, QLabel,
     QPushButton, QCheckBox, QComboBox, QFrame, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot, QUrl, QMetaObject, Q_ARG
-from PyQt6.QtGui import QFont, QAction
+from PyQt6.QtCore import (
+    Qt, QTimer, QElapsedTimer, QThreadPool, pyqtSignal, pyqtSlot, QUrl, QMetaObject, Q_ARG
+)
+from PyQt6.QtGui import QAction
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 
@@ -22,6 +23,7 @@ from .video_widget import DancerVideoWidget, TeacherVideoWidget
 from .score_widget import ScoreWidget
 from .controls_widget import ControlsWidget
 from .calibration_dialog import CalibrationDialog, CalibrationOverlay
+from .fonts import ui_font
 from .session_report import SessionReportDialog
 from ..workers.webcam_worker import WebcamWorker
 from ..workers.video_worker import VideoWorker
@@ -31,6 +33,7 @@ from ..core.pose_detector import PoseResult
 from ..core.pose_normalizer import PoseNormalizer, NormalizedPose
 from ..core.scoring_engine import ScoringEngine, ScoreResult
 from ..core.session_tracker import SessionTracker
+from ..core.teacher_track import TeacherPoseTrack
 
 
 class SetupPage(QWidget):
@@ -39,14 +42,16 @@ class SetupPage(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._video_path: Optional[str] = None
+        # Start stays disabled until the camera scan has finished, so a
+        # session never opens a device the scan is still probing
+        self._cameras_ready = False
         self._media_player: Optional[QMediaPlayer] = None
         self._audio_output: Optional[QAudioOutput] = None
         self._is_previewing = False
         self._setup_ui()
 
     def _setup_ui(self):
-        # Main background
-        self.setStyleSheet("background: #1f2937;")  # gray-800
+        # Styles for the page live in dark.qss (keyed on the object names)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(32, 32, 32, 32)
@@ -56,7 +61,7 @@ class SetupPage(QWidget):
         from PyQt6.QtWidgets import QStackedLayout, QSizePolicy
 
         preview_frame = QFrame()
-        preview_frame.setStyleSheet("background: #0a0a0a; border-radius: 12px;")
+        preview_frame.setObjectName("setupPreviewFrame")
         preview_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         preview_layout = QVBoxLayout(preview_frame)
         preview_layout.setContentsMargins(0, 0, 0, 0)
@@ -66,7 +71,7 @@ class SetupPage(QWidget):
         self._video_widget = QVideoWidget()
         self._video_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self._video_widget.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
-        self._video_widget.setStyleSheet("background: #0a0a0a;")
+        self._video_widget.setObjectName("setupPreviewVideo")
         self._video_widget.hide()
         preview_layout.addWidget(self._video_widget, 1)
 
@@ -74,31 +79,14 @@ class SetupPage(QWidget):
         self._preview_placeholder = QLabel("Select a video to preview")
         self._preview_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._preview_placeholder.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self._preview_placeholder.setStyleSheet("""
-            font-size: 18px;
-            color: #666666;
-            background: #0a0a0a;
-        """)
+        self._preview_placeholder.setObjectName("setupPreviewPlaceholder")
         preview_layout.addWidget(self._preview_placeholder, 1)
 
         # Play button below video
         self._play_preview_btn = QPushButton("▶ Play Preview")
         self._play_preview_btn.setFixedHeight(44)
         self._play_preview_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._play_preview_btn.setStyleSheet("""
-            QPushButton {
-                background: #2563eb;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 0 24px;
-            }
-            QPushButton:hover {
-                background: #3b82f6;
-            }
-        """)
+        self._play_preview_btn.setObjectName("playPreviewButton")
         self._play_preview_btn.clicked.connect(self._toggle_preview)
         self._play_preview_btn.hide()
         preview_layout.addWidget(self._play_preview_btn, 0, Qt.AlignmentFlag.AlignCenter)
@@ -108,93 +96,72 @@ class SetupPage(QWidget):
         # Right side - Controls
         right_panel = QWidget()
         right_panel.setFixedWidth(360)  # Fixed width for controls
-        right_panel.setStyleSheet("background: transparent;")
+        right_panel.setObjectName("setupPanel")
         right_layout = QVBoxLayout(right_panel)
         right_layout.setContentsMargins(0, 0, 0, 0)
         right_layout.setSpacing(24)
 
         # Title section
         title = QLabel("AI Dance Training")
-        title.setFont(QFont("Arial", 28, QFont.Weight.Bold))
-        title.setStyleSheet("color: white; background: transparent;")
+        title.setFont(ui_font(28, bold=True))
+        title.setObjectName("setupTitle")
         right_layout.addWidget(title)
 
         subtitle = QLabel("Load a dance video, follow along,\nand get real-time feedback")
-        subtitle.setFont(QFont("Arial", 13))
-        subtitle.setStyleSheet("color: #9ca3af; background: transparent;")
+        subtitle.setFont(ui_font(13))
+        subtitle.setObjectName("setupHint")
         right_layout.addWidget(subtitle)
 
         right_layout.addSpacing(16)
 
         # Video load section
         video_frame = QFrame()
-        video_frame.setStyleSheet("""
-            QFrame {
-                background: #1e293b;
-                border-radius: 12px;
-            }
-        """)
+        video_frame.setObjectName("setupSection")
         video_layout = QVBoxLayout(video_frame)
         video_layout.setContentsMargins(20, 20, 20, 20)
         video_layout.setSpacing(12)
 
         video_title = QLabel("1. Load Teacher Video")
-        video_title.setFont(QFont("Arial", 15, QFont.Weight.Bold))
-        video_title.setStyleSheet("color: white; background: transparent;")
+        video_title.setFont(ui_font(15, bold=True))
+        video_title.setObjectName("setupSectionTitle")
         video_layout.addWidget(video_title)
 
         self._video_status = QLabel("No video loaded")
-        self._video_status.setFont(QFont("Arial", 12))
-        self._video_status.setStyleSheet("color: #9ca3af; background: transparent;")
+        self._video_status.setFont(ui_font(12))
+        self._video_status.setObjectName("setupHint")
         video_layout.addWidget(self._video_status)
 
         self._load_btn = QPushButton("Browse Video File...")
-        self._load_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        self._load_btn.setFont(ui_font(12, bold=True))
         self._load_btn.setFixedHeight(44)
         self._load_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._load_btn.setStyleSheet("""
-            QPushButton {
-                background: #2563eb;
-                color: white;
-                border: none;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                background: #3b82f6;
-            }
-            QPushButton:pressed {
-                background: #1d4ed8;
-            }
-        """)
+        self._load_btn.setObjectName("browseButton")
         video_layout.addWidget(self._load_btn)
 
         right_layout.addWidget(video_frame)
 
         # Options section
         options_frame = QFrame()
-        options_frame.setStyleSheet("""
-            QFrame {
-                background: #1e293b;
-                border-radius: 12px;
-            }
-        """)
+        options_frame.setObjectName("setupSection")
         options_layout = QVBoxLayout(options_frame)
         options_layout.setContentsMargins(20, 20, 20, 20)
         options_layout.setSpacing(12)
 
         options_title = QLabel("2. Options")
-        options_title.setFont(QFont("Arial", 15, QFont.Weight.Bold))
-        options_title.setStyleSheet("color: white; background: transparent;")
+        options_title.setFont(ui_font(15, bold=True))
+        options_title.setObjectName("setupSectionTitle")
         options_layout.addWidget(options_title)
 
         # Camera selection
         camera_label = QLabel("Camera:")
-        camera_label.setFont(QFont("Arial", 12))
-        camera_label.setStyleSheet("color: #9ca3af; background: transparent;")
+        camera_label.setFont(ui_font(12))
+        camera_label.setObjectName("setupHint")
         options_layout.addWidget(camera_label)
 
         self._camera_combo = QComboBox()
         self._camera_combo.setFixedHeight(36)
+        # Kept on the widget: with the rules in the app stylesheet instead,
+        # Qt lays the popup out differently (adds scroll arrows)
         self._camera_combo.setStyleSheet("""
             QComboBox {
                 background: #374151;
@@ -213,55 +180,24 @@ class SetupPage(QWidget):
                 color: white;
                 selection-background-color: #2563eb;
                 border: 1px solid #4b5563;
+                border-radius: 12px;
             }
         """)
+        # Placeholder until the background camera scan finishes
+        self._camera_combo.addItem("Detecting cameras…")
         options_layout.addWidget(self._camera_combo)
 
         # Checkboxes
         self._mirror_check = QCheckBox("Mirror mode (recommended)")
         self._mirror_check.setChecked(True)
-        self._mirror_check.setFont(QFont("Arial", 12))
-        self._mirror_check.setStyleSheet("""
-            QCheckBox {
-                color: #d1d5db;
-                background: transparent;
-                spacing: 6px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                background: #374151;
-                border: 1px solid #4b5563;
-            }
-            QCheckBox::indicator:checked {
-                background: #2563eb;
-                border: 1px solid #2563eb;
-            }
-        """)
+        self._mirror_check.setFont(ui_font(12))
+        self._mirror_check.setObjectName("setupOption")
         options_layout.addWidget(self._mirror_check)
 
         self._skeleton_check = QCheckBox("Show skeleton overlay")
         self._skeleton_check.setChecked(True)
-        self._skeleton_check.setFont(QFont("Arial", 12))
-        self._skeleton_check.setStyleSheet("""
-            QCheckBox {
-                color: #d1d5db;
-                background: transparent;
-                spacing: 6px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                background: #374151;
-                border: 1px solid #4b5563;
-            }
-            QCheckBox::indicator:checked {
-                background: #2563eb;
-                border: 1px solid #2563eb;
-            }
-        """)
+        self._skeleton_check.setFont(ui_font(12))
+        self._skeleton_check.setObjectName("setupOption")
         options_layout.addWidget(self._skeleton_check)
 
         right_layout.addWidget(options_frame)
@@ -270,25 +206,11 @@ class SetupPage(QWidget):
 
         # Start button
         self._start_btn = QPushButton("Start Training Session")
-        self._start_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self._start_btn.setFont(ui_font(14, bold=True))
         self._start_btn.setFixedHeight(50)
         self._start_btn.setEnabled(False)
         self._start_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._start_btn.setStyleSheet("""
-            QPushButton {
-                background: #2563eb;
-                color: white;
-                border: none;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                background: #3b82f6;
-            }
-            QPushButton:disabled {
-                background: #374151;
-                color: #6b7280;
-            }
-        """)
+        self._start_btn.setObjectName("startSessionButton")
         right_layout.addWidget(self._start_btn)
 
         layout.addWidget(right_panel)
@@ -300,8 +222,10 @@ class SetupPage(QWidget):
 
         self._video_path = path
         self._video_status.setText(f"Loaded: {name}")
-        self._video_status.setStyleSheet("color: #22c55e; background: transparent;")
-        self._start_btn.setEnabled(True)
+        self._video_status.setProperty("loaded", True)
+        self._video_status.style().unpolish(self._video_status)
+        self._video_status.style().polish(self._video_status)
+        self._update_start_enabled()
 
         # Update placeholder to show video name
         self._preview_placeholder.setText(f"📹 {name}\n\nClick Play Preview to watch")
@@ -314,7 +238,7 @@ class SetupPage(QWidget):
 
     def _toggle_preview(self):
         """Toggle video preview play/stop."""
-        if self._media_player:
+        if self._is_previewing:
             # Stop preview
             self._stop_preview()
             self._preview_placeholder.setText(f"Video loaded\n\nClick Play to preview")
@@ -330,14 +254,18 @@ class SetupPage(QWidget):
         if not self._video_path:
             return
 
-        self._audio_output = QAudioOutput()
-        self._audio_output.setVolume(0.5)
+        # One player for the page, created on first use and then reused
+        if self._media_player is None:
+            self._audio_output = QAudioOutput(self)
+            self._audio_output.setVolume(0.5)
+
+            self._media_player = QMediaPlayer(self)
+            self._media_player.setAudioOutput(self._audio_output)
+            self._media_player.setVideoOutput(self._video_widget)
+            self._media_player.mediaStatusChanged.connect(self._on_media_status)
 
-        self._media_player = QMediaPlayer()
-        self._media_player.setAudioOutput(self._audio_output)
-        self._media_player.setVideoOutput(self._video_widget)
         self._media_player.setSource(QUrl.fromLocalFile(self._video_path))
-        self._media_player.mediaStatusChanged.connect(self._on_media_status)
+        self._is_previewing = True
 
         # Show video widget, hide placeholder
         self._preview_placeholder.hide()
@@ -348,24 +276,16 @@ class SetupPage(QWidget):
 
     def _on_media_status(self, status):
         """Handle media status changes for looping."""
-        if self._media_player and status == QMediaPlayer.MediaStatus.EndOfMedia:
+        if self._is_previewing and status == QMediaPlayer.MediaStatus.EndOfMedia:
             self._media_player.setPosition(0)
             self._media_player.play()
 
     def _stop_preview(self):
-        """Stop video preview and cleanup."""
-        if self._media_player:
+        """Stop video preview and release the file (the player is kept)."""
+        if self._is_previewing:
+            self._is_previewing = False
             self._media_player.stop()
-            try:
-                self._media_player.mediaStatusChanged.disconnect()
-            except:
-                pass
             self._media_player.setSource(QUrl())
-            self._media_player.deleteLater()
-            self._media_player = None
-        if self._audio_output:
-            self._audio_output.deleteLater()
-            self._audio_output = None
 
     def stop_preview(self):
         """Public method to stop preview (called when starting training)."""
@@ -380,6 +300,12 @@ class SetupPage(QWidget):
         self._camera_combo.clear()
         for cam in cameras:
             self._camera_combo.addItem(cam['name'], cam['id'])
+        self._cameras_ready = True
+        self._update_start_enabled()
+
+    def _update_start_enabled(self):
+        """Enable Start once a video is loaded and the cameras are known."""
+        self._start_btn.setEnabled(self._video_path is not None and self._cameras_ready)
 
     @property
     def video_path(self) -> Optional[str]:
@@ -401,6 +327,9 @@ class SetupPage(QWidget):
 class MainWindow(QMainWindow):
     """Main application window - OPTIMIZED with threaded pose detection."""
 
+    # Emitted from the thread pool when camera enumeration finishes
+    _cameras_discovered = pyqtSignal(list)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("AI Dance Training")
@@ -417,6 +346,13 @@ class MainWindow(QMainWindow):
         self._video_worker: Optional[VideoWorker] = None
         self._pose_worker: Optional[PoseWorker] = None
         self._audio_worker: Optional[AudioWorker] = None
+        self._retired_workers: list = []  # Stopped threads that hadn't exited yet
+
+        # Precomputed teacher poses (None = detect teacher poses live)
+        self._teacher_track: Optional[TeacherPoseTrack] = None
+
+        # Calibration overlay, shown between session start and training
+        self._calibration_widget: Optional[CalibrationOverlay] = None
 
         # State
         self._current_dancer_pose: Optional[PoseResult] = None
@@ -427,24 +363,22 @@ class MainWindow(QMainWindow):
         self._teacher_normalized: Optional[NormalizedPose] = None
         self._is_training = False
         self._is_cleaning_up = False  # Flag to prevent processing during cleanup
-        self._frame_width = 1280
-        self._frame_height = 720
         self._pending_video_path: Optional[str] = None
 
-        # Frame timing for throttling pose requests
-        self._last_dancer_pose_request = 0.0
-        self._last_teacher_pose_request = 0.0
-        self._pose_request_interval = 1.0 / 30  # Request pose 30 times/sec for smoother skeleton
-
-        # Score update timer
-        self._score_timer = QTimer(self)
-        self._score_timer.timeout.connect(self._update_score)
-        self._score_timer.setInterval(150)  # Update score every 150ms
-
-        # Audio position update timer (for video sync)
-        self._audio_sync_timer = QTimer(self)
-        self._audio_sync_timer.timeout.connect(self._update_audio_position)
-        self._audio_sync_timer.setInterval(16)  # ~60fps for smooth sync
+        # Scoring runs when both poses have advanced, at most every 150ms
+        # (the score smoothing is tuned for that cadence)
+        self._dancer_pose_seq = 0
+        self._teacher_pose_seq = 0
+        self._scored_pose_seqs = (0, 0)
+        self._score_interval_ms = 150
+        self._last_score_ms = -self._score_interval_ms
+        self._elapsed = QElapsedTimer()  # Monotonic integer-ms clock for throttling
+        self._elapsed.start()
+
+        # Video end check (the worker's finished signal isn't connected)
+        self._end_check_timer = QTimer(self)
+        self._end_check_timer.timeout.connect(self._check_video_ended)
+        self._end_check_timer.setInterval(1000)
 
         self._setup_ui()
         self._setup_menu()
@@ -509,10 +443,14 @@ class MainWindow(QMainWindow):
             QWidget { color: white; }
         """)
 
-        # Populate cameras
-        cameras = WebcamWorker.list_cameras()
-        if cameras:
-            self._setup_page.populate_cameras(cameras)
+        # Populate cameras in the background; probing devices can take
+        # seconds and would otherwise delay the first paint
+        self._cameras_discovered.connect(self._setup_page.populate_cameras)
+        QThreadPool.globalInstance().start(self._discover_cameras)
+
+    def _discover_cameras(self):
+        """Enumerate cameras (runs on a pool thread)."""
+        self._cameras_discovered.emit(WebcamWorker.list_cameras())
 
     def _setup_menu(self):
         """Setup menu bar."""
@@ -583,8 +521,9 @@ class MainWindow(QMainWindow):
         from PyQt6.QtWidgets import QApplication
         QApplication.processEvents()
 
-        # Defer heavy initialization to next event loop iteration
-        QTimer.singleShot(100, self._initialize_session)
+        # Defer heavy initialization to next event loop iteration (the
+        # training page has already been painted by processEvents above)
+        QTimer.singleShot(0, self._initialize_session)
 
     def _initialize_session(self):
         """Initialize session workers (called after UI updates)."""
@@ -607,6 +546,9 @@ class MainWindow(QMainWindow):
         )
         self._pose_worker.start()
 
+        # Use precomputed teacher poses if preprocess_teacher.py was run
+        self._teacher_track = TeacherPoseTrack.load_for_video(video_path)
+
         # Initialize video worker
         self._video_worker = VideoWorker()
         if not self._video_worker.load(video_path):
@@ -621,7 +563,7 @@ class MainWindow(QMainWindow):
         self._video_worker.progress.connect(
             self._on_video_progress, Qt.ConnectionType.QueuedConnection
         )
-        # Don't connect finished signal - we poll for video end in _update_score instead
+        # Don't connect finished signal - we poll for video end in _check_video_ended instead
 
         # Initialize audio worker for sound playback
         self._audio_worker = AudioWorker(self)
@@ -654,13 +596,15 @@ class MainWindow(QMainWindow):
         self._teacher_normalizer.reset_smoothing()
         self._scoring_engine.reset()
         self._session_tracker.reset()
+        # One score per throttle interval, with headroom for seeks/replays
+        self._session_tracker.reserve(
+            int(self._video_worker.duration_ms / self._score_interval_ms * 1.5)
+        )
         self._score_widget.reset()
         self._controls.reset()
         self._controls.set_duration(self._video_worker.duration_ms)
         self._dancer_widget.reset()
         self._teacher_widget.reset()
-        self._last_dancer_pose_request = 0.0
-        self._last_teacher_pose_request = 0.0
 
         # Start workers
         self._webcam_worker.start()
@@ -673,10 +617,12 @@ class MainWindow(QMainWindow):
 
     def _show_calibration(self):
         """Show calibration as overlay instead of modal dialog."""
-        # Create calibration widget as overlay on the training page
-        self._calibration_widget = CalibrationOverlay(self.centralWidget())
-        self._calibration_widget.calibration_complete.connect(self._on_calibration_complete)
-        self._calibration_widget.cancelled.connect(self._cancel_session)
+        # Create calibration widget as overlay on the training page once;
+        # later sessions reuse it (it is reset when hidden)
+        if self._calibration_widget is None:
+            self._calibration_widget = CalibrationOverlay(self.centralWidget())
+            self._calibration_widget.calibration_complete.connect(self._on_calibration_complete)
+            self._calibration_widget.cancelled.connect(self._cancel_session)
 
         # Position it centered on screen
         self._calibration_widget.move(
@@ -685,30 +631,17 @@ class MainWindow(QMainWindow):
         )
         self._calibration_widget.show()
         self._calibration_widget.raise_()
+        # Dancer poses are pushed to it from _on_dancer_pose_ready
 
-        # Update calibration with pose data
-        self._calibration_timer = QTimer(self)
-        self._calibration_timer.timeout.connect(self._update_calibration)
-        self._calibration_timer.start(100)
-
-    def _update_calibration(self):
-        """Update calibration overlay with pose data."""
-        if hasattr(self, '_calibration_widget') and self._calibration_widget:
-            if self._current_dancer_pose:
-                self._calibration_widget.update_pose(
-                    self._current_dancer_pose,
-                    self._frame_width,
-                    self._frame_height
-                )
+    def _hide_calibration(self):
+        """Hide the calibration overlay and reset it for the next session."""
+        if self._calibration_widget is not None:
+            self._calibration_widget.hide()
+            self._calibration_widget.reset()
 
     def _on_calibration_complete(self):
         """Handle calibration complete."""
-        if hasattr(self, '_calibration_timer'):
-            self._calibration_timer.stop()
-        if hasattr(self, '_calibration_widget') and self._calibration_widget:
-            self._calibration_widget.hide()
-            self._calibration_widget.deleteLater()
-            self._calibration_widget = None
+        self._hide_calibration()
         self._start_training()
 
     def _start_training(self):
@@ -723,8 +656,7 @@ class MainWindow(QMainWindow):
         if self._audio_worker:
             self._audio_worker.play()  # Start audio with video
         self._controls.set_playing(True)
-        self._score_timer.start()
-        self._audio_sync_timer.start()  # Start audio position sync
+        self._end_check_timer.start()
 
     def _cancel_session(self):
         """Cancel session and return to setup."""
@@ -732,21 +664,12 @@ class MainWindow(QMainWindow):
         if self._is_cleaning_up:
             return
 
-        # Stop calibration timer first
-        if hasattr(self, '_calibration_timer') and self._calibration_timer:
-            self._calibration_timer.stop()
-            self._calibration_timer = None
-
         # Hide calibration widget
-        if hasattr(self, '_calibration_widget') and self._calibration_widget:
-            self._calibration_widget.hide()
-            self._calibration_widget.deleteLater()
-            self._calibration_widget = None
+        self._hide_calibration()
 
         # Stop timers
         self._is_training = False
-        self._score_timer.stop()
-        self._audio_sync_timer.stop()
+        self._end_check_timer.stop()
 
         # Stop all workers immediately (non-blocking)
         self._stop_all_workers()
@@ -760,41 +683,62 @@ class MainWindow(QMainWindow):
     @pyqtSlot(object, float)
     def _on_dancer_frame(self, frame, timestamp_ms: float):
         """Handle webcam frame - display immediately, queue pose detection."""
+        try:
+            self._handle_dancer_frame(frame, timestamp_ms)
+        finally:
+            # Hand the in-flight slot back so capture can emit the next frame
+            if self._webcam_worker:
+                self._webcam_worker.frame_consumed()
+
+    def _handle_dancer_frame(self, frame, timestamp_ms: float):
         # Guard: skip if cleaning up
         if self._is_cleaning_up:
             return
 
-        self._frame_height, self._frame_width = frame.shape[:2]
         self._current_dancer_frame = frame
 
         # Always update display immediately (smooth video!)
         self._dancer_widget.update_frame(frame, self._current_dancer_pose)
 
-        # Queue pose detection at limited rate
-        current_time = time.perf_counter()
-        if (current_time - self._last_dancer_pose_request) >= self._pose_request_interval:
-            self._last_dancer_pose_request = current_time
-            if self._pose_worker and self._pose_worker._running:
-                self._pose_worker.process_dancer_frame(frame, timestamp_ms)
+        # Queue pose detection; the worker keeps only the latest frame and
+        # picks it up when it finishes the previous one
+        if self._pose_worker and self._pose_worker._running:
+            self._pose_worker.process_dancer_frame(frame, timestamp_ms)
 
     @pyqtSlot(object, float)
     def _on_teacher_frame(self, frame, timestamp_ms: float):
         """Handle teacher video frame - display immediately, queue pose detection."""
+        try:
+            self._handle_teacher_frame(frame, timestamp_ms)
+        finally:
+            # Hand the in-flight slot back so decoding can continue
+            if self._video_worker:
+                self._video_worker.frame_consumed()
+
+    def _handle_teacher_frame(self, frame, timestamp_ms: float):
         # Guard: skip if cleaning up
         if self._is_cleaning_up:
             return
 
         self._current_teacher_frame = frame
 
+        # Precomputed poses: look up by timestamp, no detection needed
+        if self._teacher_track is not None:
+            pose = self._teacher_track.pose_at(timestamp_ms)
+            self._current_teacher_pose = pose
+            self._teacher_widget.update_frame(frame, pose)
+            if pose and self._is_training:
+                self._teacher_normalized = self._teacher_track.normalized_at(timestamp_ms)
+                self._teacher_pose_seq += 1
+                self._maybe_update_score()
+            return
+
         # Always update display immediately
         self._teacher_widget.update_frame(frame, self._current_teacher_pose)
 
-        # Queue pose detection at limited rate
-        current_time = time.perf_counter()
-        if (current_time - self._last_teacher_pose_request) >= self._pose_request_interval:
-            self._last_teacher_pose_request = current_time
-            if self._pose_worker and self._pose_worker._running:
-                self._pose_worker.process_teacher_frame(frame, timestamp_ms)
+        # Queue pose detection (latest frame only)
+        if self._pose_worker and self._pose_worker._running:
+            self._pose_worker.process_teacher_frame(frame, timestamp_ms)
 
     @pyqtSlot(object, float)
     def _on_dancer_pose_ready(self, pose: Optional[PoseResult], timestamp: float):
@@ -809,20 +753,33 @@ class MainWindow(QMainWindow):
         if self._current_dancer_frame is not None:
             self._dancer_widget.update_frame(self._current_dancer_frame, pose)
 
+        # Feed calibration checks (the overlay coalesces to its refresh rate)
+        if (self._calibration_widget is not None and self._calibration_widget.isVisible()
+                and self._current_dancer_frame is not None):
+            # Frame size is only needed here, so it isn't tracked per frame
+            frame_height, frame_width = self._current_dancer_frame.shape[:2]
+            self._calibration_widget.update_pose(pose, frame_width, frame_height)
+
         # Normalize for scoring
         if pose and self._is_training:
             self._dancer_normalized = self._dancer_normalizer.normalize(
                 pose,
                 mirror=self._setup_page.mirror_enabled,
             )
+            self._dancer_pose_seq += 1
+            self._maybe_update_score()
 
-    @pyqtSlot(object, float)
-    def _on_teacher_pose_ready(self, pose: Optional[PoseResult], timestamp: float):
+    @pyqtSlot(object, float, int)
+    def _on_teacher_pose_ready(self, pose: Optional[PoseResult], timestamp: float, generation: int):
         """Handle pose detection result from worker thread."""
         # Guard: skip if cleaning up
         if self._is_cleaning_up:
             return
 
+        # Detected before the last seek/restart - don't draw or score it
+        if self._pose_worker is None or generation != self._pose_worker.teacher_generation:
+            return
+
         self._current_teacher_pose = pose
 
         # Update display with skeleton
@@ -836,22 +793,33 @@ class MainWindow(QMainWindow):
                 mirror=False,
                 apply_smoothing=True,
             )
+            self._teacher_pose_seq += 1
+            self._maybe_update_score()
 
-    def _update_audio_position(self):
-        """Update cached audio position for thread-safe video sync."""
-        if self._audio_worker:
-            self._audio_worker.update_cached_position()
+    def _check_video_ended(self):
+        """End the session once the teacher video has finished (runs on timer)."""
+        if self._is_training and self._video_worker and self._video_worker.has_ended:
+            QTimer.singleShot(0, self._on_end_session)
 
-    def _update_score(self):
-        """Update score display (runs on timer)."""
+    def _maybe_update_score(self):
+        """Score once both poses have advanced since the last score."""
         if not self._is_training:
             return
 
-        # Check if video has ended
-        if self._video_worker and self._video_worker.has_ended:
-            QTimer.singleShot(0, self._on_end_session)
+        dancer_seq, teacher_seq = self._scored_pose_seqs
+        if self._dancer_pose_seq == dancer_seq or self._teacher_pose_seq == teacher_seq:
+            return
+
+        now_ms = self._elapsed.elapsed()
+        if now_ms - self._last_score_ms < self._score_interval_ms:
             return
 
+        self._scored_pose_seqs = (self._dancer_pose_seq, self._teacher_pose_seq)
+        self._last_score_ms = now_ms
+        self._update_score()
+
+    def _update_score(self):
+        """Update score display."""
         if self._dancer_normalized and self._teacher_normalized:
             result = self._scoring_engine.compare_frames(
                 self._dancer_normalized,
@@ -862,9 +830,8 @@ class MainWindow(QMainWindow):
             self._score_widget.update_score(result)
 
             # Track for session report
-            if self._video_worker and self._video_worker._cap:
-                timestamp = self._video_worker._cap.get(0)  # CAP_PROP_POS_MSEC
-                self._session_tracker.add_score(timestamp, result)
+            if self._video_worker:
+                self._session_tracker.add_score(self._video_worker.position_ms, result)
 
     @pyqtSlot(float, float)
     def _on_video_progress(self, current_ms: float, duration_ms: float):
@@ -893,11 +860,9 @@ class MainWindow(QMainWindow):
                     self._audio_worker.pause()
 
             if is_playing:
-                self._score_timer.start()
-                self._audio_sync_timer.start()
+                self._end_check_timer.start()
             else:
-                self._score_timer.stop()
-                self._audio_sync_timer.stop()
+                self._end_check_timer.stop()
 
     def _on_restart(self):
         """Restart from beginning."""
@@ -907,12 +872,20 @@ class MainWindow(QMainWindow):
             self._score_widget.reset()
             self._scoring_engine.reset()
             self._dancer_normalizer.reset_smoothing()
-            self._teacher_normalizer.reset_smoothing()
+            self._reset_teacher_pose()
 
             # Sync audio to beginning
             if self._audio_worker:
                 self._audio_worker.seek(0)
 
+    def _reset_teacher_pose(self):
+        """Forget the teacher pose after the video jumped (seek/restart)."""
+        self._current_teacher_pose = None
+        self._teacher_normalized = None
+        self._teacher_normalizer.reset_smoothing()
+        if self._pose_worker:
+            self._pose_worker.reset_teacher()
+
     def _on_speed_changed(self, speed: float):
         """Change playback speed."""
         if self._video_worker:
@@ -926,6 +899,7 @@ class MainWindow(QMainWindow):
         """Seek to position."""
         if self._video_worker:
             self._video_worker.seek(position_ms)
+            self._reset_teacher_pose()
 
         # Sync audio position
         if self._audio_worker:
@@ -938,8 +912,7 @@ class MainWindow(QMainWindow):
             return
 
         self._is_training = False
-        self._score_timer.stop()
-        self._audio_sync_timer.stop()
+        self._end_check_timer.stop()
 
         # Get session results before cleanup
         result = self._session_tracker.get_session_result()
@@ -981,21 +954,18 @@ class MainWindow(QMainWindow):
         self._is_training = False
 
         # Stop timers immediately
-        self._score_timer.stop()
-        self._audio_sync_timer.stop()
+        self._end_check_timer.stop()
 
-        # Signal threads to stop - DON'T disconnect signals (can cause deadlock)
-        # Set all flags atomically
+        # Signal threads to stop - DON'T disconnect signals (can cause deadlock).
+        # stop() also wakes them from any wait, so they exit promptly.
         if self._video_worker:
-            self._video_worker._running = False
-            self._video_worker._playing = False
-            self._video_worker._use_audio_sync = False
+            self._video_worker.stop()
 
         if self._webcam_worker:
-            self._webcam_worker._running = False
+            self._webcam_worker.stop()
 
         if self._pose_worker:
-            self._pose_worker._running = False
+            self._pose_worker.stop()  # Also wakes it if idle
 
         # Stop audio BEFORE waiting for threads (it's not threaded)
         if self._audio_worker:
@@ -1004,35 +974,30 @@ class MainWindow(QMainWindow):
             except:
                 pass
 
-        # Process pending events to flush signal queue
-        from PyQt6.QtWidgets import QApplication
-        QApplication.processEvents()
+        # No processEvents() here: frames/poses still queued from the
+        # worker threads are delivered by the event loop before the
+        # deferred _finalize_cleanup runs, and return early in their slots
+
+    def _join_worker(self, worker):
+        """Wait for a stopped worker thread to exit, without killing it."""
+        if worker.isRunning() and not worker.wait(500):
+            # Still inside a blocking call (camera open, model load). It
+            # exits once that returns; keep a reference so the QThread
+            # isn't destroyed while running.
+            self._retired_workers.append(worker)
 
     def _finalize_cleanup(self):
         """Finalize cleanup of worker threads (called after delay)."""
-        # Wait briefly for threads to finish naturally, then terminate if needed
-        wait_ms = 100  # Short wait time
+        # Threads stopped by _stop_all_workers exit on their own; drop the
+        # ones left over from earlier sessions that have finished since
+        self._retired_workers = [w for w in self._retired_workers if w.isRunning()]
 
-        if self._video_worker:
-            if self._video_worker.isRunning():
-                if not self._video_worker.wait(wait_ms):
-                    self._video_worker.terminate()
-                    self._video_worker.wait(50)
-            self._video_worker = None
-
-        if self._webcam_worker:
-            if self._webcam_worker.isRunning():
-                if not self._webcam_worker.wait(wait_ms):
-                    self._webcam_worker.terminate()
-                    self._webcam_worker.wait(50)
-            self._webcam_worker = None
-
-        if self._pose_worker:
-            if self._pose_worker.isRunning():
-                if not self._pose_worker.wait(wait_ms):
-                    self._pose_worker.terminate()
-                    self._pose_worker.wait(50)
-            self._pose_worker = None
+        for worker in (self._video_worker, self._webcam_worker, self._pose_worker):
+            if worker is not None:
+                self._join_worker(worker)
+        self._video_worker = None
+        self._webcam_worker = None
+        self._pose_worker = None
 
         # Cleanup audio
         if self._audio_worker:
@@ -1049,6 +1014,7 @@ class MainWindow(QMainWindow):
         self._current_teacher_frame = None
         self._dancer_normalized = None
         self._teacher_normalized = None
+        self._teacher_track = None
 
         # Reset cleanup flag
         self._is_cleaning_up = False
@@ -1056,8 +1022,7 @@ class MainWindow(QMainWindow):
     def _cleanup_session(self):
         """Cleanup workers and state."""
         self._is_training = False
-        self._score_timer.stop()
-        self._audio_sync_timer.stop()
+        self._end_check_timer.stop()
         self._stop_all_workers()
         QTimer.singleShot(100, self._finalize_cleanup)
 
@@ -49,6 +49,11 @@ def format_time(ms: float) -> str:
 class ScoreTimeline(QWidget):
     """Visual timeline of scores."""
 
+    # Bar colours, shared by every bar instead of built per bar per paint
+    _COLOR_HIGH = QColor("#3b82f6")  # blue
+    _COLOR_MID = QColor("#eab308")  # yellow
+    _COLOR_LOW = QColor("#ef4444")  # red
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._scores = []
@@ -78,11 +83,11 @@ class ScoreTimeline(QWidget):
 
             # Get color based on score
             if score >= 80:
-                color = QColor("#3b82f6")  # blue
+                color = self._COLOR_HIGH
             elif score >= 60:
-                color = QColor("#eab308")  # yellow
+                color = self._COLOR_MID
             else:
-                color = QColor("#ef4444")  # red
+                color = self._COLOR_LOW
 
             painter.fillRect(
                 int(x), height - bar_height - 10,
@@ -3,7 +3,6 @@ Video Widget - Display video frames with skeleton overlay.
 Simple and clean design.
 """
 
-import cv2
 import numpy as np
 from typing import Optional
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QSizePolicy
@@ -24,6 +23,7 @@ class VideoWidget(QWidget):
         self._show_skeleton = True
         self._skeleton_drawer = SkeletonDrawer(smoothing=0.5)  # Higher smoothing for smoother skeleton
         self._last_pose: Optional[PoseResult] = None  # Store last pose for continuous drawing
+        self._draw_buf: Optional[np.ndarray] = None  # Reused skeleton drawing target
         self._setup_ui()
 
     def _setup_ui(self):
@@ -83,18 +83,21 @@ class VideoWidget(QWidget):
 
         # Draw skeleton if enabled (use last pose for continuous smooth drawing)
         if self._show_skeleton and self._last_pose:
+            # Draw on a copy in a reused buffer (reallocated only when the
+            # resolution changes) - the caller's frame gets redrawn later
+            if self._draw_buf is None or self._draw_buf.shape != frame.shape:
+                self._draw_buf = np.empty_like(frame)
+            np.copyto(self._draw_buf, frame)
             frame = self._skeleton_drawer.draw(
-                frame.copy(),
+                self._draw_buf,
                 pose,  # Pass current pose (can be None, smoother will interpolate)
                 is_dancer=self.is_dancer,
             )
 
-        # Convert BGR to RGB
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-
-        # Create QImage and scale
-        img = QImage(rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
+        # Wrap the BGR frame as-is (no RGB conversion pass or extra copy);
+        # fromImage() converts it straight into the pixmap's own buffer
+        h, w = frame.shape[:2]
+        img = QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888)
         pixmap = QPixmap.fromImage(img)
 
         # Scale to fit
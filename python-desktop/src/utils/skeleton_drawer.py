@@ -6,39 +6,8 @@ Enhanced with SMOOTH interpolation between poses.
 
 import cv2
 import numpy as np
-from typing import List, Tuple, Optional
-from ..core.pose_detector import PoseResult, Keypoint
-
-
-class SmoothKeypoint:
-    """Keypoint with smoothing/interpolation."""
-
-    def __init__(self, smoothing: float = 0.5):
-        self.x = 0.0
-        self.y = 0.0
-        self.visibility = 0.0
-        self.smoothing = smoothing
-        self._initialized = False
-
-    def update(self, kp: Keypoint):
-        """Update with new keypoint, applying smoothing."""
-        if not self._initialized:
-            self.x = kp.x
-            self.y = kp.y
-            self.visibility = kp.visibility
-            self._initialized = True
-        else:
-            # Exponential smoothing for smooth movement
-            s = self.smoothing
-            self.x = s * self.x + (1 - s) * kp.x
-            self.y = s * self.y + (1 - s) * kp.y
-            self.visibility = s * self.visibility + (1 - s) * kp.visibility
-
-    def to_pixel(self, width: int, height: int) -> Tuple[int, int]:
-        return int(self.x * width), int(self.y * height)
-
-    def reset(self):
-        self._initialized = False
+from typing import Tuple, Optional
+from ..core.pose_detector import PoseResult
 
 
 class SkeletonSmoother:
@@ -50,21 +19,30 @@ class SkeletonSmoother:
             num_keypoints: Number of keypoints (33 for MediaPipe)
             smoothing: 0-1, higher = smoother but more lag
         """
-        self.keypoints = [SmoothKeypoint(smoothing) for _ in range(num_keypoints)]
+        self.num_keypoints = num_keypoints
         self.smoothing = smoothing
+        # (num_keypoints, 3) x, y, visibility - float64 like the Python floats it replaces
+        self.points = np.zeros((num_keypoints, 3))
+        self._initialized = False
 
-    def update(self, pose: Optional[PoseResult]) -> List[SmoothKeypoint]:
-        """Update with new pose, return smoothed keypoints."""
-        if pose and pose.keypoints:
-            for i, kp in enumerate(pose.keypoints):
-                if i < len(self.keypoints):
-                    self.keypoints[i].update(kp)
-        return self.keypoints
+    def update(self, pose: Optional[PoseResult]) -> Optional[np.ndarray]:
+        """Update with new pose, return smoothed points (None before the first pose)."""
+        if pose is not None and len(pose.landmarks):
+            new = pose.landmarks[:self.num_keypoints, (0, 1, 3)]
+            n = len(new)
+            if not self._initialized:
+                self.points[:n] = new
+                self._initialized = True
+            else:
+                # Exponential smoothing for smooth movement, in place
+                s = self.smoothing
+                self.points[:n] *= s
+                self.points[:n] += (1 - s) * new
+        return self.points if self._initialized else None
 
     def reset(self):
         """Reset all keypoints."""
-        for kp in self.keypoints:
-            kp.reset()
+        self._initialized = False
 
 
 class SkeletonDrawer:
@@ -79,6 +57,7 @@ class SkeletonDrawer:
     TEACHER_COLOR = (107, 107, 255)   # Red #ff6b6b
     JOINT_COLOR_HIGH = (0, 255, 0)    # Green for high confidence
     JOINT_COLOR_LOW = (0, 165, 255)   # Orange for low confidence
+    JOINT_CENTER_COLOR = (255, 255, 255)  # White inner circle
 
     # Skeleton connections
     CONNECTIONS = [
@@ -120,6 +99,15 @@ class SkeletonDrawer:
         # Single smoother per drawer (each VideoWidget has its own SkeletonDrawer)
         self._smoother = SkeletonSmoother(smoothing=smoothing)
 
+        # Drawing state resolved once instead of on every frame
+        self._line_type = cv2.LINE_AA if antialiased else cv2.LINE_8
+        self._inner_radius = joint_radius - 2
+        num_points = self._smoother.num_keypoints
+        self._edges = np.array([
+            (start_idx, end_idx) for start_idx, end_idx in self.CONNECTIONS
+            if start_idx < num_points and end_idx < num_points
+        ], dtype=np.intp).reshape(-1, 2)
+
     def draw(
         self,
         frame: np.ndarray,
@@ -142,10 +130,10 @@ class SkeletonDrawer:
             Frame with skeleton overlay
         """
         # Update smoother with new pose (even if None, keeps last position)
-        smooth_keypoints = self._smoother.update(pose)
+        smooth_points = self._smoother.update(pose)
 
         # Check if we have valid data
-        if not any(kp._initialized for kp in smooth_keypoints):
+        if smooth_points is None:
             return frame
 
         # Choose color
@@ -160,49 +148,28 @@ class SkeletonDrawer:
         else:
             overlay = frame
 
-        # Draw connections (lines)
-        for start_idx, end_idx in self.CONNECTIONS:
-            if start_idx >= len(smooth_keypoints) or end_idx >= len(smooth_keypoints):
-                continue
-
-            start_kp = smooth_keypoints[start_idx]
-            end_kp = smooth_keypoints[end_idx]
-
-            # Check confidence
-            if start_kp.visibility < self.min_confidence or end_kp.visibility < self.min_confidence:
-                continue
+        # Pixel coordinates and confidence mask for all keypoints at once
+        points = (smooth_points[:, :2] * (width, height)).astype(np.int32)
+        visible = smooth_points[:, 2] >= self.min_confidence
 
-            # Get pixel coordinates
-            start_pt = start_kp.to_pixel(width, height)
-            end_pt = end_kp.to_pixel(width, height)
-
-            # Draw line
-            line_type = cv2.LINE_AA if self.antialiased else cv2.LINE_8
-            cv2.line(
+        # Draw connections (lines) between confident joints in one call:
+        # each edge is a 2-point polyline, (M, 2, 2) endpoint pairs
+        edges = self._edges[visible[self._edges].all(axis=1)]
+        if len(edges):
+            cv2.polylines(
                 overlay,
-                start_pt,
-                end_pt,
+                points[edges],
+                False,
                 color,
                 self.line_thickness,
-                lineType=line_type,
+                lineType=self._line_type,
             )
 
         # Draw joints (circles)
-        for i, kp in enumerate(smooth_keypoints):
-            if kp.visibility < self.min_confidence:
-                continue
-
-            pt = kp.to_pixel(width, height)
-
-            # Color based on confidence
-            if kp.visibility > 0.8:
-                joint_color = self.JOINT_COLOR_HIGH
-            else:
-                joint_color = self.JOINT_COLOR_LOW
-
+        for pt in map(tuple, points[visible].tolist()):
             # Draw outer ring (color) and inner circle (white)
             cv2.circle(overlay, pt, self.joint_radius, color, -1, cv2.LINE_AA)
-            cv2.circle(overlay, pt, self.joint_radius - 2, (255, 255, 255), -1, cv2.LINE_AA)
+            cv2.circle(overlay, pt, self._inner_radius, self.JOINT_CENTER_COLOR, -1, cv2.LINE_AA)
 
         # Apply alpha blending
         if alpha < 1.0:
@@ -41,6 +41,7 @@ class AudioWorker(QObject):
             # Create media player
             self._player = QMediaPlayer()
             self._player.setAudioOutput(self._audio_output)
+            self._player.positionChanged.connect(self._on_position_changed)
             self._player.setSource(QUrl.fromLocalFile(video_path))
 
             return True
@@ -102,12 +103,11 @@ class AudioWorker(QObject):
         with self._position_lock:
             return self._cached_position
 
-    def update_cached_position(self):
-        """Update cached position for thread-safe access. Call from main thread only."""
-        if self._player:
-            pos = float(self._player.position())
-            with self._position_lock:
-                self._cached_position = pos
+    @pyqtSlot('qint64')
+    def _on_position_changed(self, position: int):
+        """Refresh the cached position whenever the player reports a new one."""
+        with self._position_lock:
+            self._cached_position = float(position)
 
     def cleanup(self):
         """Clean up resources."""
@@ -5,8 +5,9 @@ This prevents pose detection from blocking the UI.
 """
 
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker
+from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker, QWaitCondition
 from ..core.pose_detector import PoseDetector, PoseResult
 
 
@@ -14,28 +15,48 @@ class PoseWorker(QThread):
     """
     Runs pose detection in a separate thread for smooth UI.
 
-    Receives frames, processes them, emits results.
-    Uses SEPARATE detectors for dancer and teacher to avoid tracking interference.
+    Receives frames, processes them, emits results. Only the latest frame
+    per source is kept, so a slow detector drops frames instead of
+    falling behind. Uses SEPARATE detectors for dancer and teacher to avoid tracking interference.
+
+    The dancer stream is detected on this thread and the teacher stream on
+    a helper thread, so the two run in parallel at their own pace
+    (MediaPipe releases the GIL during inference).
     """
 
     # Signals
     dancer_pose_ready = pyqtSignal(object, float)  # PoseResult, timestamp
-    teacher_pose_ready = pyqtSignal(object, float)  # PoseResult, timestamp
+    teacher_pose_ready = pyqtSignal(object, float, int)  # PoseResult, timestamp, generation
     ready = pyqtSignal()  # Emitted when MediaPipe is initialized
     error = pyqtSignal(str)
 
-    def __init__(self, model_complexity: int = 0):
+    def __init__(self, model_complexity: int = 0, model_path: Optional[str] = None):
         super().__init__()
         self._model_complexity = model_complexity
+        self._model_path = model_path  # Custom (e.g. quantized) model bundle, see PoseDetector
         self._running = False
         # Separate detectors to avoid tracking state interference
         self._dancer_detector: Optional[PoseDetector] = None
         self._teacher_detector: Optional[PoseDetector] = None
+        self._teacher_pool: Optional[ThreadPoolExecutor] = None
         self._mutex = QMutex()
+        self._frame_queued = QWaitCondition()  # Wakes run() when a frame arrives
 
-        # Queued frames
+        # Queued frames (latest only)
         self._dancer_frame: Optional[tuple] = None  # (frame, timestamp)
-        self._teacher_frame: Optional[tuple] = None
+        self._teacher_frame: Optional[tuple] = None  # (frame, timestamp, generation)
+        self._teacher_busy = False  # A teacher detection is running on the helper thread
+        # Bumped by reset_teacher(). Teacher frames and results carry the
+        # generation they were queued in, so anything from before a reset
+        # can be told apart (see teacher_generation)
+        self._teacher_generation = 0
+        self._detector_generation = 0  # Generation the teacher detector was last reset for
+
+        # Last result emitted per stream. In async mode the detector keeps
+        # returning the same result until a newer one finishes; repeats
+        # are dropped here instead of being queued to the GUI thread.
+        self._last_dancer_pose: object = None
+        self._last_teacher_pose: object = None
 
     def run(self):
         """Main thread loop."""
@@ -44,39 +65,48 @@ class PoseWorker(QThread):
             # This prevents MediaPipe's internal tracking from getting confused
             self._dancer_detector = PoseDetector(
                 model_complexity=self._model_complexity,
+                model_path=self._model_path,
                 min_detection_confidence=0.5,
                 min_tracking_confidence=0.5,
+                use_async=True,
+                detect_every=2,  # Used on the (synchronous) legacy API only
             )
             self._teacher_detector = PoseDetector(
                 model_complexity=self._model_complexity,
+                model_path=self._model_path,
                 min_detection_confidence=0.5,
                 min_tracking_confidence=0.5,
+                use_async=True,
+                detect_every=2,  # Used on the (synchronous) legacy API only
             )
+            # Runs the teacher stream alongside the dancer one (see _run_teacher)
+            self._teacher_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="teacher-pose")
             self._running = True
 
             # Signal that we're ready
             self.ready.emit()
 
             while self._running:
-                if not self._running:
-                    break
-
-                dancer_frame = None
-                teacher_frame = None
-
-                # Get queued frames
+                # Take the queued frames, sleeping until there is work: a
+                # dancer frame, or a teacher frame while the helper is idle
                 with QMutexLocker(self._mutex):
+                    while self._running and self._dancer_frame is None and (
+                        self._teacher_frame is None or self._teacher_busy
+                    ):
+                        self._frame_queued.wait(self._mutex)
                     if not self._running:
                         break
-                    if self._dancer_frame:
-                        dancer_frame = self._dancer_frame
-                        self._dancer_frame = None
-                    if self._teacher_frame:
+                    dancer_frame = self._dancer_frame
+                    self._dancer_frame = None
+                    teacher_frame = None
+                    if not self._teacher_busy:
                         teacher_frame = self._teacher_frame
                         self._teacher_frame = None
+                        self._teacher_busy = teacher_frame is not None
 
-                if not self._running:
-                    break
+                # Hand the teacher stream to the helper thread
+                if teacher_frame is not None:
+                    self._teacher_pool.submit(self._run_teacher, teacher_frame)
 
                 # Process dancer frame with dancer detector
                 if dancer_frame is not None and self._running:
@@ -84,48 +114,84 @@ class PoseWorker(QThread):
                     try:
                         pose = self._dancer_detector.detect(frame, timestamp)
                         # Double-check running before emit
-                        if self._running:
+                        if self._running and pose is not self._last_dancer_pose:
+                            self._last_dancer_pose = pose
                             self.dancer_pose_ready.emit(pose, timestamp)
                     except:
                         pass
 
-                if not self._running:
-                    break
-
-                # Process teacher frame with teacher detector
-                if teacher_frame is not None and self._running:
-                    frame, timestamp = teacher_frame
-                    try:
-                        pose = self._teacher_detector.detect(frame, timestamp)
-                        # Double-check running before emit
-                        if self._running:
-                            self.teacher_pose_ready.emit(pose, timestamp)
-                    except:
-                        pass
-
-                # Small sleep if no work
-                if dancer_frame is None and teacher_frame is None:
-                    self.msleep(5)
-
         except Exception as e:
             self.error.emit(str(e))
         finally:
+            # Let an in-flight teacher detection finish before closing it
+            if self._teacher_pool:
+                self._teacher_pool.shutdown(wait=True)
             if self._dancer_detector:
                 self._dancer_detector.close()
             if self._teacher_detector:
                 self._teacher_detector.close()
 
+    def _run_teacher(self, teacher_frame: tuple):
+        """Detect teacher frames on the helper thread until none is queued."""
+        while teacher_frame is not None and self._running:
+            frame, timestamp, generation = teacher_frame
+            if generation != self._detector_generation:
+                # First frame after reset_teacher()
+                self._teacher_detector.reset()
+                self._last_teacher_pose = None
+                self._detector_generation = generation
+            try:
+                pose = self._teacher_detector.detect(frame, timestamp)
+                # Double-check running before emit
+                if self._running and pose is not self._last_teacher_pose:
+                    self._last_teacher_pose = pose
+                    self.teacher_pose_ready.emit(pose, timestamp, generation)
+            except:
+                pass
+
+            # Pick up the next frame, or go idle and let run() resubmit
+            with QMutexLocker(self._mutex):
+                teacher_frame = self._teacher_frame
+                self._teacher_frame = None
+                if teacher_frame is None:
+                    self._teacher_busy = False
+
     def process_dancer_frame(self, frame: np.ndarray, timestamp: float):
         """Queue dancer frame for processing."""
+        # Copy outside the lock so run() isn't blocked on a full-frame memcpy
+        queued = (frame.copy(), timestamp)
         with QMutexLocker(self._mutex):
             # Only keep latest frame (drop old ones)
-            self._dancer_frame = (frame.copy(), timestamp)
+            self._dancer_frame = queued
+            self._frame_queued.wakeOne()
 
     def process_teacher_frame(self, frame: np.ndarray, timestamp: float):
         """Queue teacher frame for processing."""
+        frame = frame.copy()
+        with QMutexLocker(self._mutex):
+            self._teacher_frame = (frame, timestamp, self._teacher_generation)
+            # A busy helper picks it up itself when it finishes
+            if not self._teacher_busy:
+                self._frame_queued.wakeOne()
+
+    def reset_teacher(self):
+        """
+        Drop the queued teacher frame and the teacher detector's previous
+        pose, e.g. after the video was seeked or restarted. Results already
+        in flight keep the old generation; receivers drop those by
+        comparing with teacher_generation.
+        """
         with QMutexLocker(self._mutex):
-            self._teacher_frame = (frame.copy(), timestamp)
+            self._teacher_frame = None
+            self._teacher_generation += 1
+
+    @property
+    def teacher_generation(self) -> int:
+        """Current teacher reset generation (see reset_teacher)."""
+        return self._teacher_generation
 
     def stop(self):
         """Stop the worker (non-blocking)."""
-        self._running = False
+        with QMutexLocker(self._mutex):
+            self._running = False
+            self._frame_queued.wakeAll()
@@ -7,6 +7,7 @@ SYNCED with audio using audio position as master clock.
 
 import cv2
 import time
+import threading
 import numpy as np
 from typing import Optional, Callable
 from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker
@@ -26,15 +27,35 @@ class VideoWorker(QThread):
     error = pyqtSignal(str)
     loaded = pyqtSignal(float, int, int)  # duration_ms, width, height
 
+    # Frames emitted but not yet consumed by the GUI thread. Decoding waits
+    # for a free slot so frames never pile up in the event queue.
+    MAX_FRAMES_IN_FLIGHT = 2
+
+    # Frames are read into a ring of reused buffers instead of a fresh array
+    # each time. A buffer is only overwritten once the GUI has consumed its
+    # frame and moved on (it keeps the latest one for redraws).
+    FRAME_BUFFERS = MAX_FRAMES_IN_FLIGHT + 2
+
+    # Audio sync: when video falls this far (ms) behind the audio, seek
+    # instead of dropping frames one by one
+    SYNC_SEEK_MS = 500
+
     def __init__(self):
         super().__init__()
         self._video_path: Optional[str] = None
         self._cap: Optional[cv2.VideoCapture] = None
         self._running = False
+        self._stop_event = threading.Event()  # Set by stop(); also wakes the loop's waits
         self._playing = False
         self._playback_rate = 1.0
         self._seek_to_ms: Optional[float] = None
         self._mutex = QMutex()
+        self._frame_slots = threading.Semaphore(self.MAX_FRAMES_IN_FLIGHT)
+        self._buffers: list = [None] * self.FRAME_BUFFERS
+        self._buffer_idx = 0
+        # Last emitted frame position, published for the GUI thread so it
+        # doesn't have to query the capture the worker is reading from
+        self._last_pts_ms = 0.0
 
         # Audio sync - callback to get audio position
         self._audio_position_getter: Optional[Callable[[], float]] = None
@@ -85,14 +106,16 @@ class VideoWorker(QThread):
             return
 
         try:
-            self._cap = cv2.VideoCapture(self._video_path)
+            self._cap = self._open_capture(self._video_path)
             if not self._cap.isOpened():
                 self.error.emit("Failed to open video for playback")
                 return
 
-            self._running = True
+            self._running = not self._stop_event.is_set()  # stop() may come before run()
             frame_interval_base = 1.0 / self.fps
+            frame_ms = 1000.0 / self.fps
             last_frame_time = time.perf_counter()
+            next_frame_time = last_frame_time  # Audio sync mode deadline
             last_video_ms = 0.0
 
             while self._running:
@@ -103,8 +126,10 @@ class VideoWorker(QThread):
                     if self._seek_to_ms is not None:
                         frame_num = int((self._seek_to_ms / 1000) * self.fps)
                         self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
+                        self._last_pts_ms = self._seek_to_ms
                         self._seek_to_ms = None
                         last_frame_time = time.perf_counter()
+                        next_frame_time = last_frame_time
 
                     is_playing = self._playing
                     playback_rate = self._playback_rate
@@ -116,28 +141,58 @@ class VideoWorker(QThread):
 
                 # Sleep outside of mutex if paused
                 if not is_playing:
-                    time.sleep(0.01)
+                    self._stop_event.wait(0.01)
                     continue
 
-                # Audio sync mode
+                # Audio sync mode: each frame is due one interval after the
+                # last, stretched or shrunk by the cube of how far that frame
+                # was from the audio clock; frames are dropped or repeated
+                # once the drift exceeds a whole frame
                 if use_audio_sync and audio_getter:
                     if not self._running:
                         break
                     try:
+                        frame_interval = frame_interval_base / playback_rate
+                        current_time = time.perf_counter()
+                        if current_time < next_frame_time:
+                            self._stop_event.wait(next_frame_time - current_time)
+                            continue
+
+                        # Drift of the frame due now (positive = video ahead)
                         audio_ms = audio_getter()
-                        video_ms = self._cap.get(cv2.CAP_PROP_POS_MSEC)
-                        drift = audio_ms - video_ms
+                        drift = self._last_pts_ms + frame_ms - audio_ms
 
-                        if drift > 100:
+                        if drift < -self.SYNC_SEEK_MS:
+                            # Far behind (e.g. after an audio seek) - jump there
                             target_frame = int((audio_ms / 1000) * self.fps)
                             self._cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-                        elif drift < -50:
-                            time.sleep(0.005)
+                            self._last_pts_ms = audio_ms - frame_ms
                             continue
 
-                        ret, frame = self._cap.read()
+                        if drift < -frame_ms:
+                            # Behind by over a frame - drop one. grab() skips
+                            # the conversion and copy that read() does
+                            if not self._cap.grab():
+                                self._playing = False
+                                self._video_ended = True
+                                break
+                            self._last_pts_ms = self._cap.get(cv2.CAP_PROP_POS_MSEC)
+                            continue
+
+                        if drift > frame_ms:
+                            # Ahead by over a frame - show the current one
+                            # for another interval
+                            next_frame_time = current_time + frame_interval
+                            continue
+
+                        # Back-pressure: wait for the GUI to consume a frame
+                        if not self._frame_slots.acquire(timeout=0.05):
+                            continue
+
+                        ret, frame = self._read_frame()
                         if not ret:
                             # Video ended - just stop, don't emit (main thread detects via progress)
+                            self._frame_slots.release()
                             self._playing = False
                             self._video_ended = True
                             break
@@ -145,15 +200,19 @@ class VideoWorker(QThread):
                         if not self._running:
                             break
 
+                        # Cubic correction: small drifts (the audio clock is
+                        # coarse) barely change the pace, larger ones pull hard
+                        ratio = drift / frame_ms
+                        next_frame_time = current_time + frame_interval * (1.0 + ratio * ratio * ratio)
                         current_ms = self._cap.get(cv2.CAP_PROP_POS_MSEC)
+                        self._last_pts_ms = current_ms
                         # Check running before emit to minimize queued signals
                         if self._running:
                             self.frame_ready.emit(frame, current_ms)
                             self.progress.emit(current_ms, self.duration_ms)
-                        time.sleep(frame_interval_base / 2)
 
                     except:
-                        time.sleep(0.01)
+                        self._stop_event.wait(0.01)
                         continue
                 else:
                     # Normal timing mode
@@ -162,12 +221,17 @@ class VideoWorker(QThread):
                     elapsed = current_time - last_frame_time
 
                     if elapsed < frame_interval:
-                        time.sleep(0.001)
+                        self._stop_event.wait(frame_interval - elapsed)
+                        continue
+
+                    # Back-pressure: wait for the GUI to consume a frame
+                    if not self._frame_slots.acquire(timeout=0.05):
                         continue
 
-                    ret, frame = self._cap.read()
+                    ret, frame = self._read_frame()
                     if not ret:
                         # Video ended - just stop, don't emit (main thread detects via progress)
+                        self._frame_slots.release()
                         self._playing = False
                         self._video_ended = True
                         break
@@ -177,6 +241,7 @@ class VideoWorker(QThread):
 
                     last_frame_time = current_time
                     current_ms = self._cap.get(cv2.CAP_PROP_POS_MSEC)
+                    self._last_pts_ms = current_ms
                     # Check running before emit to minimize queued signals
                     if self._running:
                         self.frame_ready.emit(frame, current_ms)
@@ -188,6 +253,34 @@ class VideoWorker(QThread):
             if self._cap:
                 self._cap.release()
 
+    @staticmethod
+    def _open_capture(video_path: str) -> cv2.VideoCapture:
+        """Open a video for playback, with hardware decoding where available."""
+        # FFmpeg picks a hardware decoder (D3D11VA, VAAPI, VideoToolbox, ...)
+        # and quietly decodes in software if none can be used
+        cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [
+            cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+        ])
+        if cap.isOpened():
+            return cap
+
+        # OpenCV build without the FFmpeg backend - use the default one
+        cap.release()
+        return cv2.VideoCapture(video_path)
+
+    def _read_frame(self):
+        """cap.read() into the next ring buffer (allocated on first use)."""
+        idx = self._buffer_idx
+        ret, frame = self._cap.read(self._buffers[idx])
+        if ret:
+            self._buffers[idx] = frame
+            self._buffer_idx = (idx + 1) % self.FRAME_BUFFERS
+        return ret, frame
+
+    def frame_consumed(self):
+        """Release an in-flight slot (call once per received frame)."""
+        self._frame_slots.release()
+
     def play(self):
         """Start playback."""
         with QMutexLocker(self._mutex):
@@ -209,6 +302,7 @@ class VideoWorker(QThread):
         self._playing = False
         # Disable audio sync to prevent blocking
         self._use_audio_sync = False
+        self._stop_event.set()
 
     def seek(self, position_ms: float):
         """Seek to position in milliseconds."""
@@ -218,8 +312,7 @@ class VideoWorker(QThread):
 
     def seek_relative(self, offset_ms: float):
         """Seek relative to current position."""
-        current = self._cap.get(cv2.CAP_PROP_POS_MSEC) if self._cap else 0
-        self.seek(current + offset_ms)
+        self.seek(self._last_pts_ms + offset_ms)
 
     def set_playback_rate(self, rate: float):
         """Set playback speed (0.25 - 2.0)."""
@@ -243,3 +336,8 @@ class VideoWorker(QThread):
     def has_ended(self) -> bool:
         """Check if video has ended."""
         return self._video_ended
+
+    @property
+    def position_ms(self) -> float:
+        """Position of the last emitted frame in milliseconds."""
+        return self._last_pts_ms
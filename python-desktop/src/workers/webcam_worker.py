@@ -6,6 +6,7 @@ Non-blocking for smooth UI.
 
 import cv2
 import time
+import threading
 import numpy as np
 from typing import Optional
 from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker
@@ -23,14 +24,32 @@ class WebcamWorker(QThread):
     started_signal = pyqtSignal()
     stopped_signal = pyqtSignal()
 
+    # Frames emitted but not yet consumed by the GUI thread. Capture drops
+    # frames rather than letting more than this pile up in the event queue.
+    MAX_FRAMES_IN_FLIGHT = 2
+
+    # Frames are read into a ring of reused buffers instead of a fresh array
+    # each time. A buffer is only overwritten once the GUI has consumed its
+    # frame and moved on (it keeps the latest one for redraws).
+    FRAME_BUFFERS = MAX_FRAMES_IN_FLIGHT + 2
+
     def __init__(
         self,
         device_id: int = 0,
         target_fps: int = 30,
-        width: int = 1280,
-        height: int = 720,
+        width: int = 640,
+        height: int = 360,
         mirror: bool = True,
     ):
+        """
+        Args:
+            device_id: Camera index
+            target_fps: Capture rate
+            width, height: Requested capture size. Pose detection works on
+                frames of at most 480px (PoseDetector.max_input_size), so
+                capturing larger only adds copy/flip/display work.
+            mirror: Flip frames horizontally
+        """
         super().__init__()
         self.device_id = device_id
         self.target_fps = target_fps
@@ -39,10 +58,14 @@ class WebcamWorker(QThread):
         self.mirror = mirror
 
         self._running = False
+        self._stop_event = threading.Event()  # Set by stop(); also wakes the loop's waits
         self._paused = False
         self._cap: Optional[cv2.VideoCapture] = None
         self._mutex = QMutex()
         self._start_time = 0.0
+        self._frame_slots = threading.Semaphore(self.MAX_FRAMES_IN_FLIGHT)
+        self._buffers: list = [None] * self.FRAME_BUFFERS
+        self._buffer_idx = 0
 
     def run(self):
         """Main thread loop - capture frames."""
@@ -59,7 +82,7 @@ class WebcamWorker(QThread):
             self._cap.set(cv2.CAP_PROP_FPS, self.target_fps)
             self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Minimize latency
 
-            self._running = True
+            self._running = not self._stop_event.is_set()  # stop() may come before run()
             self._start_time = time.perf_counter() * 1000
             self.started_signal.emit()
 
@@ -74,7 +97,7 @@ class WebcamWorker(QThread):
                     is_paused = self._paused
 
                 if is_paused:
-                    time.sleep(0.01)
+                    self._stop_event.wait(0.01)
                     continue
 
                 if not self._running:
@@ -83,12 +106,21 @@ class WebcamWorker(QThread):
                 # Timing control
                 current_time = time.perf_counter()
                 if current_time - last_frame_time < frame_interval:
-                    time.sleep(0.001)
+                    self._stop_event.wait(frame_interval - (current_time - last_frame_time))
+                    continue
+
+                # GUI still busy with earlier frames - drop this one. grab()
+                # keeps the camera from queueing stale frames without
+                # touching the ring buffers, which may still be on screen
+                if not self._frame_slots.acquire(blocking=False):
+                    self._cap.grab()
+                    last_frame_time = current_time
                     continue
 
                 # Capture frame
-                ret, frame = self._cap.read()
+                ret, frame = self._read_frame()
                 if not ret:
+                    self._frame_slots.release()
                     continue
 
                 if not self._running:
@@ -99,7 +131,7 @@ class WebcamWorker(QThread):
 
                 # Mirror if needed
                 if self.mirror:
-                    frame = cv2.flip(frame, 1)
+                    cv2.flip(frame, 1, dst=frame)  # In place, keeps the ring buffer
 
                 # Emit frame only if still running (double-check)
                 if self._running:
@@ -118,6 +150,20 @@ class WebcamWorker(QThread):
     def stop(self):
         """Stop capturing (non-blocking)."""
         self._running = False
+        self._stop_event.set()
+
+    def _read_frame(self):
+        """cap.read() into the next ring buffer (allocated on first use)."""
+        idx = self._buffer_idx
+        ret, frame = self._cap.read(self._buffers[idx])
+        if ret:
+            self._buffers[idx] = frame
+            self._buffer_idx = (idx + 1) % self.FRAME_BUFFERS
+        return ret, frame
+
+    def frame_consumed(self):
+        """Release an in-flight slot (call once per received frame)."""
+        self._frame_slots.release()
 
     def pause(self):
         """Pause capturing."""